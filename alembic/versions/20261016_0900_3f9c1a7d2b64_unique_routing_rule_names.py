@@ -0,0 +1,60 @@
+"""unique routing rule names
+
+Revision ID: 3f9c1a7d2b64
+Revises:
+Create Date: 2026-10-16 09:00:00.000000
+
+Routing rule creation and seeding rely on ``ON CONFLICT (name)``, which
+needs a unique index on ``routing_rules.name``. Tables created before the
+column was declared unique lack it, and the old non-atomic seed may have
+left duplicate names behind; keep the oldest rule of each name.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1a7d2b64'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "uq_routing_rules_name"
+
+
+def _has_unique_name(inspector: sa.Inspector) -> bool:
+    """Whether ``routing_rules.name`` is already unique (e.g. via create_all)."""
+    constraints = inspector.get_unique_constraints("routing_rules")
+    indexes = [i for i in inspector.get_indexes("routing_rules") if i["unique"]]
+    return any(c["column_names"] == ["name"] for c in constraints + indexes)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("routing_rules") or _has_unique_name(inspector):
+        return
+
+    op.execute(
+        """
+        DELETE FROM routing_rules
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY name ORDER BY created_at, id
+                ) AS rn
+                FROM routing_rules
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+    op.create_index(INDEX_NAME, "routing_rules", ["name"], unique=True)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if any(i["name"] == INDEX_NAME for i in inspector.get_indexes("routing_rules")):
+        op.drop_index(INDEX_NAME, table_name="routing_rules")
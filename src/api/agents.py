@@ -8,12 +8,14 @@ from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from loguru import logger
 
-from src.database import get_async_db
+from src.database import dialect_insert, get_async_db
 from src.models.agent import Agent, AgentStatus, AgentRole
 from src.schemas.agent import (
     AgentCreate,
@@ -27,6 +29,53 @@ from src.schemas.common import PaginatedResponse
 
 router = APIRouter()
 
+# Built once at import; validating a whole page in one call avoids
+# per-item model_validate overhead on list endpoints
+_agent_list_adapter = TypeAdapter(List[AgentResponse])
+
+# Search terms shorter than a trigram cannot use the pg_trgm index
+TRIGRAM_MIN_LENGTH = 3
+
+
+def _agent_search_filter(search: str, dialect: str):
+    """
+    Build the name/email search filter for the given SQL dialect.
+    
+    On PostgreSQL, uses the pg_trgm ``%`` similarity operator so the
+    ``agents_*_trgm`` GIN indexes can answer the query; short terms fall
+    back to a prefix ``ILIKE`` which can use a btree index. Other dialects
+    keep the plain substring match.
+    """
+    if dialect != "postgresql":
+        return or_(
+            Agent.name.ilike(f"%{search}%"),
+            Agent.email.ilike(f"%{search}%")
+        )
+    
+    if len(search) < TRIGRAM_MIN_LENGTH:
+        return or_(
+            Agent.name.ilike(f"{search}%"),
+            Agent.email.ilike(f"{search}%")
+        )
+    
+    return or_(
+        Agent.name.op("%")(search),
+        Agent.email.op("%")(search)
+    )
+
+
+def _json_array_contains(column, value: str, dialect: str):
+    """
+    Build a "JSON array column contains value" filter for the given SQL dialect.
+    
+    On PostgreSQL, uses the JSONB ``@>`` operator so the ``agents_*_gin``
+    indexes can answer the query. Other dialects store the array as text
+    and match the quoted element.
+    """
+    if dialect == "postgresql":
+        return type_coerce(column, JSONB).contains([value])
+    return column.like(f'%"{value}"%')
+
 
 @router.post("", response_model=AgentResponse, status_code=status.HTTP_201_CREATED)
 async def create_agent(
@@ -35,20 +84,11 @@ async def create_agent(
 ) -> AgentResponse:
     """Create a new agent."""
     
-    # Check if email already exists
-    result = await db.execute(
-        select(Agent).where(Agent.email == agent_data.email)
-    )
-    existing = result.scalar_one_or_none()
+    insert = dialect_insert(db)
     
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Agent with email {agent_data.email} already exists"
-        )
-    
-    # Create agent
-    agent = Agent(
+    # Insert and fetch the new row in one round trip; a conflicting email
+    # returns no row instead of raising
+    stmt = insert(Agent).values(
         email=agent_data.email,
         name=agent_data.name,
         display_name=agent_data.display_name,
@@ -71,11 +111,18 @@ async def create_agent(
         freshdesk_agent_id=agent_data.freshdesk_agent_id,
         status=AgentStatus.OFFLINE,
         is_active=True
-    )
+    ).on_conflict_do_nothing(index_elements=["email"]).returning(Agent)
+    
+    result = await db.execute(stmt)
+    agent = result.scalar_one_or_none()
+    
+    if agent is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Agent with email {agent_data.email} already exists"
+        )
     
-    db.add(agent)
     await db.commit()
-    await db.refresh(agent)
     
     logger.info(f"Created agent: {agent.name} ({agent.email})")
     
@@ -117,7 +164,7 @@ async def list_agents(
     sort_by: str = Query("name"),
     sort_order: str = Query("asc"),
     db: AsyncSession = Depends(get_async_db)
-) -> PaginatedResponse[AgentResponse]:
+) -> Response:
     """List agents with filtering and pagination."""
     
     query = select(Agent)
@@ -140,18 +187,17 @@ async def list_agents(
             Agent.current_load < Agent.max_load
         ))
     if skill:
-        filters.append(Agent.skills.contains([skill]))
+        filters.append(_json_array_contains(Agent.skills, skill, db.bind.dialect.name))
     if language:
-        filters.append(Agent.languages.contains([language]))
+        filters.append(
+            _json_array_contains(Agent.languages, language, db.bind.dialect.name)
+        )
     if can_handle_critical is not None:
         filters.append(Agent.can_handle_critical == can_handle_critical)
     if can_handle_vip is not None:
         filters.append(Agent.can_handle_vip == can_handle_vip)
     if search:
-        filters.append(or_(
-            Agent.name.ilike(f"%{search}%"),
-            Agent.email.ilike(f"%{search}%")
-        ))
+        filters.append(_agent_search_filter(search, db.bind.dialect.name))
     
     if filters:
         query = query.where(and_(*filters))
@@ -175,12 +221,18 @@ async def list_agents(
     result = await db.execute(query)
     agents = result.scalars().all()
     
-    return PaginatedResponse.create(
-        items=[AgentResponse.model_validate(a) for a in agents],
+    page_data = PaginatedResponse[AgentResponse].create(
+        items=_agent_list_adapter.validate_python(agents, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    
+    # Serialize directly; the items are already validated
+    return Response(
+        content=page_data.model_dump_json(),
+        media_type="application/json"
+    )
 
 
 @router.patch("/{agent_id}", response_model=AgentResponse)
@@ -4,6 +4,7 @@ Analytics API Endpoints
 Provides analytics and reporting for tickets and agents.
 """
 
+import asyncio
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from uuid import UUID
@@ -13,7 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, case
 from loguru import logger
 
-from src.database import get_async_db
+from src.database import AsyncSessionLocal, get_async_db
 from src.models.ticket import Ticket, TicketStatus
 from src.models.agent import Agent
 from src.models.category import Category
@@ -21,10 +22,21 @@ from src.models.category import Category
 router = APIRouter()
 
 
+async def _fetch_all(query) -> list:
+    """
+    Execute a read-only query on its own pooled session.
+    
+    Used to run independent aggregates concurrently; an AsyncSession
+    must never be shared between concurrently running tasks.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(query)
+        return result.all()
+
+
 @router.get("/overview")
 async def get_overview(
-    period_days: int = Query(30, ge=1, le=365),
-    db: AsyncSession = Depends(get_async_db)
+    period_days: int = Query(30, ge=1, le=365)
 ) -> Dict[str, Any]:
     """
     Get overview analytics for the dashboard.
@@ -57,9 +69,6 @@ async def get_overview(
         ).filter(Ticket.resolved_at.isnot(None)).label("avg_resolution_hours")
     ).where(Ticket.created_at >= period_start)
     
-    result = await db.execute(counts_query)
-    counts = result.one()
-    
     # Category distribution
     category_query = select(
         Ticket.category,
@@ -71,18 +80,12 @@ async def get_overview(
         )
     ).group_by(Ticket.category)
     
-    cat_result = await db.execute(category_query)
-    categories = {row.category: row.count for row in cat_result}
-    
     # Priority distribution
     priority_query = select(
         Ticket.priority,
         func.count(Ticket.id).label("count")
     ).where(Ticket.created_at >= period_start).group_by(Ticket.priority)
     
-    pri_result = await db.execute(priority_query)
-    priorities = {str(row.priority): row.count for row in pri_result}
-    
     # Sentiment distribution
     sentiment_query = select(
         Ticket.sentiment,
@@ -94,8 +97,19 @@ async def get_overview(
         )
     ).group_by(Ticket.sentiment)
     
-    sent_result = await db.execute(sentiment_query)
-    sentiments = {row.sentiment: row.count for row in sent_result}
+    # The aggregates are independent, so run them concurrently on
+    # separate connections from the pool
+    count_rows, cat_rows, pri_rows, sent_rows = await asyncio.gather(
+        _fetch_all(counts_query),
+        _fetch_all(category_query),
+        _fetch_all(priority_query),
+        _fetch_all(sentiment_query),
+    )
+    
+    counts = count_rows[0]
+    categories = {row.category: row.count for row in cat_rows}
+    priorities = {str(row.priority): row.count for row in pri_rows}
+    sentiments = {row.sentiment: row.count for row in sent_rows}
     
     return {
         "period_days": period_days,
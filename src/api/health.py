@@ -4,21 +4,67 @@ Health Check Endpoints
 Provides health and readiness checks for the API.
 """
 
+import asyncio
+import time
 from datetime import datetime
-from typing import Dict, Any
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Depends
+from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-import redis.asyncio as redis
 
+from src.cache import get_redis
 from src.database import get_async_db
 from src.config import settings
 from src.schemas.common import HealthResponse
 
 router = APIRouter()
 
+# Upper bound for the Redis ping so a hung connection cannot stall probes
+REDIS_PING_TIMEOUT = 0.5
 
+# Per-check budget for the detailed probe, kept below the probe timeout
+CHECK_TIMEOUT = 2.0
+
+# Probes and monitors poll every few seconds; results are reused for this long
+CHECK_CACHE_TTL = 10.0
+
+# The OpenAI key and model rarely change state; verify them less often
+OPENAI_CHECK_CACHE_TTL = 60.0
+
+_check_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_check_locks: Dict[str, asyncio.Lock] = {}
+
+
+def cached_check(name: str, ttl: float = CHECK_CACHE_TTL) -> Callable:
+    """
+    Cache a health check result in-process for ``ttl`` seconds.
+    
+    Concurrent callers on a miss wait for a single in-flight check
+    instead of each hitting the dependency.
+    """
+    def decorator(func: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            cached = _check_cache.get(name)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            
+            async with _check_locks.setdefault(name, asyncio.Lock()):
+                cached = _check_cache.get(name)
+                if cached and time.monotonic() - cached[0] < ttl:
+                    return cached[1]
+                
+                result = await func(*args, **kwargs)
+                _check_cache[name] = (time.monotonic(), result)
+                return result
+        return wrapper
+    return decorator
+
+
+@cached_check("database")
 async def check_database(db: AsyncSession) -> Dict[str, Any]:
     """Check database connectivity."""
     try:
@@ -28,32 +74,59 @@ async def check_database(db: AsyncSession) -> Dict[str, Any]:
         return {"status": "unhealthy", "error": str(e)}
 
 
+@cached_check("redis")
 async def check_redis() -> Dict[str, Any]:
     """Check Redis connectivity."""
     try:
-        client = redis.from_url(settings.redis_url)
-        await client.ping()
-        await client.close()
+        # Reuses the shared connection pool instead of connecting per probe
+        await asyncio.wait_for(get_redis().ping(), timeout=REDIS_PING_TIMEOUT)
         return {"status": "healthy"}
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
 
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def _get_openai_client() -> AsyncOpenAI:
+    """Get the probe's OpenAI client, created once and reused across checks."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            timeout=CHECK_TIMEOUT
+        )
+    return _openai_client
+
+
+@cached_check("openai", ttl=OPENAI_CHECK_CACHE_TTL)
 async def check_openai() -> Dict[str, Any]:
     """Check OpenAI API connectivity."""
     try:
         if not settings.openai_api_key:
             return {"status": "not_configured"}
         
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=settings.openai_api_key)
-        # Simple models list call to verify API key
-        await client.models.list()
+        # Retrieving the configured model verifies the key (and that the
+        # model is available) with a small response, unlike models.list()
+        await asyncio.wait_for(
+            _get_openai_client().models.retrieve(settings.openai_model),
+            timeout=CHECK_TIMEOUT
+        )
         return {"status": "healthy"}
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
 
+async def _run_check(check: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run a single check within CHECK_TIMEOUT, reporting failures as unhealthy."""
+    try:
+        return await asyncio.wait_for(check, timeout=CHECK_TIMEOUT)
+    except asyncio.TimeoutError:
+        return {"status": "unhealthy", "error": f"timed out after {CHECK_TIMEOUT}s"}
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check(
     db: AsyncSession = Depends(get_async_db)
@@ -93,16 +166,19 @@ async def detailed_health_check(
     - OpenAI API connectivity
     """
     
-    checks = {}
-    
-    # Database check
-    checks["database"] = await check_database(db)
-    
-    # Redis check
-    checks["redis"] = await check_redis()
+    # The checks are independent, so latency is the slowest one rather
+    # than the sum of all three
+    db_status, redis_status, openai_status = await asyncio.gather(
+        _run_check(check_database(db)),
+        _run_check(check_redis()),
+        _run_check(check_openai()),
+    )
     
-    # OpenAI check
-    checks["openai"] = await check_openai()
+    checks = {
+        "database": db_status,
+        "redis": redis_status,
+        "openai": openai_status,
+    }
     
     # Calculate overall status
     statuses = [c.get("status") for c in checks.values()]
@@ -4,18 +4,23 @@ Ticket API Endpoints
 CRUD operations and processing for support tickets.
 """
 
+import asyncio
+import hashlib
+import operator
 import time
-from typing import Optional, List
+from collections import OrderedDict
+from typing import Optional, List, Dict, Set
 from uuid import UUID
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, case, update, tuple_
 from sqlalchemy.orm import selectinload
 from loguru import logger
 
-from src.database import get_async_db
+from src.database import AsyncSessionLocal, dialect_insert, get_async_db
 from src.models.ticket import Ticket, TicketStatus
 from src.models.customer import Customer
 from src.models.agent import Agent
@@ -35,10 +40,126 @@ from src.services.sentiment import get_sentiment_analyzer
 from src.services.priority_scorer import get_priority_scorer
 from src.services.router import TicketRouter
 from src.services.rag import knowledge_base
+from src.services import semantic_cache
 from src.utils.text_processing import TextProcessor
 
 router = APIRouter()
 
+# Built once at import; validating a whole page in one call avoids
+# per-item model_validate overhead on list endpoints
+_ticket_list_adapter = TypeAdapter(List[TicketResponse])
+
+
+async def _adjust_agent_load(
+    db: AsyncSession,
+    agent_id: UUID,
+    delta: int,
+    **values
+) -> bool:
+    """
+    Atomically add delta to an agent's current load, never below zero.
+    
+    Runs a single UPDATE instead of a fetch plus attribute change; any
+    extra column values are applied in the same statement.
+    
+    Returns:
+        bool: True if the agent exists
+    """
+    new_load = Agent.current_load + delta
+    # Returning the entity refreshes any copy already in the session
+    # instead of leaving its updated attributes expired
+    result = await db.execute(
+        update(Agent)
+        .where(Agent.id == agent_id)
+        .values(current_load=case((new_load < 0, 0), else_=new_load), **values)
+        .returning(Agent)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+async def _apply_agent_load_deltas(
+    db: AsyncSession,
+    deltas: Dict[UUID, int]
+) -> Set[UUID]:
+    """
+    Apply accumulated load changes with one UPDATE per affected agent.
+    
+    Agents are updated in a stable order so concurrent batches take the
+    row locks in the same sequence.
+    
+    Returns:
+        Set[UUID]: IDs of agents that do not exist
+    """
+    missing = set()
+    for agent_id in sorted(deltas, key=str):
+        if deltas[agent_id] and not await _adjust_agent_load(db, agent_id, deltas[agent_id]):
+            missing.add(agent_id)
+    return missing
+
+
+# Detected languages keyed by content digest, so repeated content such as
+# forwarded emails and auto-replies skips langdetect without holding the text
+LANGUAGE_CACHE_SIZE = 4096
+_language_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+
+def _detect_language(content: str) -> str:
+    """Detect the content language, reusing the result for repeated content."""
+    key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+    
+    language = _language_cache.get(key)
+    if language is not None:
+        _language_cache.move_to_end(key)
+        return language
+    
+    language = TextProcessor.detect_language(content)[0]
+    _language_cache[key] = language
+    if len(_language_cache) > LANGUAGE_CACHE_SIZE:
+        _language_cache.popitem(last=False)
+    return language
+
+
+# Strong references to in-flight suggestion tasks so they are not
+# garbage collected before finishing
+_suggestion_tasks: Set[asyncio.Task] = set()
+
+
+async def _generate_suggested_responses(
+    ticket_id: UUID,
+    content: str,
+    category: Optional[str],
+    language: str
+) -> None:
+    """Generate suggested responses for a ticket and store them."""
+    
+    try:
+        # Near-duplicate tickets reuse earlier suggestions; the embedding
+        # computed for the lookup is passed on to the RAG search on a miss
+        suggestions = await semantic_cache.get_or_compute(
+            text=content,
+            category=category,
+            language=language,
+            compute_fn=lambda embedding: knowledge_base.generate_suggested_responses(
+                ticket_content=content,
+                category=category,
+                language=language,
+                limit=3,
+                query_embedding=embedding
+            )
+        )
+        
+        # The request session is closed by now; use a dedicated one
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(Ticket)
+                .where(Ticket.id == ticket_id)
+                .values(suggested_responses=suggestions)
+            )
+            await db.commit()
+    except Exception as e:
+        logger.warning(f"Suggested responses failed for ticket {ticket_id}: {e}")
+
 
 async def process_ticket_pipeline(
     ticket: Ticket,
@@ -51,18 +172,27 @@ async def process_ticket_pipeline(
     2. Analyze sentiment
     3. Calculate priority
     4. Route to agent
-    5. Generate suggested responses
+    5. Generate suggested responses (scheduled in the background and
+       stored on the ticket when ready)
     """
     
     start_time = time.time()
     results = {}
     
     try:
-        # 1. Classification
+        # 1-2. Classification and sentiment analysis are independent,
+        # so their model calls run concurrently
         classifier = get_classifier()
-        classification = await classifier.classify(
-            text=ticket.content,
-            language=ticket.language
+        analyzer = get_sentiment_analyzer()
+        classification, sentiment = await asyncio.gather(
+            classifier.classify(
+                text=ticket.content,
+                language=ticket.language
+            ),
+            analyzer.analyze(
+                text=ticket.content,
+                language=ticket.language
+            )
         )
         
         ticket.category = classification.get("primary_category")
@@ -71,13 +201,6 @@ async def process_ticket_pipeline(
         
         results["classification"] = classification
         
-        # 2. Sentiment Analysis
-        analyzer = get_sentiment_analyzer()
-        sentiment = await analyzer.analyze(
-            text=ticket.content,
-            language=ticket.language
-        )
-        
         ticket.sentiment = sentiment.get("sentiment")
         ticket.sentiment_score = sentiment.get("score")
         
@@ -118,26 +241,10 @@ async def process_ticket_pipeline(
             ticket.assignment_confidence = routing.get("confidence")
             
             # Update agent load
-            agent = await db.get(Agent, routing["agent_id"])
-            if agent:
-                agent.current_load += 1
+            await _adjust_agent_load(db, routing["agent_id"], 1)
         
         results["routing"] = routing
         
-        # 5. Suggested Responses
-        try:
-            suggestions = await knowledge_base.generate_suggested_responses(
-                ticket_content=ticket.content,
-                category=ticket.category,
-                language=ticket.language,
-                limit=3
-            )
-            ticket.suggested_responses = suggestions
-            results["suggested_responses"] = suggestions
-        except Exception as e:
-            logger.warning(f"Suggested responses failed: {e}")
-            results["suggested_responses"] = []
-        
         # Mark as processed
         ticket.is_processed = True
         ticket.status = TicketStatus.OPEN
@@ -148,6 +255,18 @@ async def process_ticket_pipeline(
         
         await db.commit()
         
+        # 5. Suggested Responses run after the commit, off the request path
+        task = asyncio.create_task(
+            _generate_suggested_responses(
+                ticket_id=ticket.id,
+                content=ticket.content,
+                category=ticket.category,
+                language=ticket.language
+            )
+        )
+        _suggestion_tasks.add(task)
+        task.add_done_callback(_suggestion_tasks.discard)
+        
         logger.info(
             f"Ticket {ticket.id} processed: "
             f"category={ticket.category}, "
@@ -164,43 +283,57 @@ async def process_ticket_pipeline(
         raise
 
 
-@router.post("", response_model=TicketProcessResponse, status_code=status.HTTP_201_CREATED)
-async def create_ticket(
+async def _process_ticket_in_background(ticket_id: UUID) -> None:
+    """Run the pipeline for a committed ticket after the response is sent."""
+    
+    # The request session is closed once the response is sent, so the
+    # pipeline gets a session of its own
+    async with AsyncSessionLocal() as db:
+        ticket = await db.get(Ticket, ticket_id)
+        if not ticket:
+            logger.warning(f"Ticket {ticket_id} vanished before processing")
+            return
+        
+        try:
+            await process_ticket_pipeline(ticket, db)
+        except Exception:
+            # Already logged and recorded on the ticket by the pipeline
+            pass
+
+
+async def _create_ticket_core(
     ticket_data: TicketCreate,
     background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession
 ) -> TicketProcessResponse:
     """
-    Create a new ticket and process it.
+    Create a ticket and process it.
     
-    - Creates ticket in database
-    - Runs AI classification, sentiment analysis, priority scoring
-    - Routes to appropriate agent
-    - Generates suggested responses
+    Shared by the create endpoint and the webhook handlers, which call
+    it directly rather than going through the route.
     """
     
-    # Find or create customer
-    customer = None
+    # Find or create customer in one atomic statement; the no-op update on
+    # conflict makes RETURNING yield the existing row's id as well
+    customer_id = None
     if ticket_data.customer_email:
-        result = await db.execute(
-            select(Customer).where(Customer.email == ticket_data.customer_email)
+        insert = dialect_insert(db)
+        stmt = insert(Customer).values(
+            email=ticket_data.customer_email,
+            name=ticket_data.customer_name,
+            tier=ticket_data.customer_tier or "standard"
         )
-        customer = result.scalar_one_or_none()
-        
-        if not customer:
-            customer = Customer(
-                email=ticket_data.customer_email,
-                name=ticket_data.customer_name,
-                tier=ticket_data.customer_tier or "standard"
-            )
-            db.add(customer)
-            await db.flush()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["email"],
+            set_={"email": stmt.excluded.email}
+        ).returning(Customer.id)
+        customer_id = (await db.execute(stmt)).scalar_one()
     
     # Create ticket
     ticket = Ticket(
         content=ticket_data.content,
         subject=ticket_data.subject,
-        customer_id=customer.id if customer else None,
+        customer_id=customer_id,
         customer_email=ticket_data.customer_email,
         customer_name=ticket_data.customer_name,
         customer_tier=ticket_data.customer_tier or "standard",
@@ -208,7 +341,7 @@ async def create_ticket(
         external_system=ticket_data.external_system,
         source=ticket_data.source or "api",
         channel=ticket_data.channel,
-        language=ticket_data.language or TextProcessor.detect_language(ticket_data.content)[0],
+        language=ticket_data.language or _detect_language(ticket_data.content),
         tags=ticket_data.tags or [],
         custom_fields=ticket_data.custom_fields or {},
         status=TicketStatus.NEW
@@ -220,8 +353,8 @@ async def create_ticket(
     # Process ticket
     if ticket_data.process_async:
         # Queue for background processing
-        background_tasks.add_task(process_ticket_pipeline, ticket, db)
         await db.commit()
+        background_tasks.add_task(_process_ticket_in_background, ticket.id)
         
         return TicketProcessResponse(
             ticket_id=ticket.id,
@@ -240,7 +373,6 @@ async def create_ticket(
                 sentiment=results.get("sentiment"),
                 priority=results.get("priority"),
                 routing=results.get("routing"),
-                suggested_responses=results.get("suggested_responses"),
                 processing_time_ms=results.get("processing_time_ms")
             )
         except Exception as e:
@@ -250,6 +382,23 @@ async def create_ticket(
             )
 
 
+@router.post("", response_model=TicketProcessResponse, status_code=status.HTTP_201_CREATED)
+async def create_ticket(
+    ticket_data: TicketCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db)
+) -> TicketProcessResponse:
+    """
+    Create a new ticket and process it.
+    
+    - Creates ticket in database
+    - Runs AI classification, sentiment analysis, priority scoring
+    - Routes to appropriate agent
+    - Schedules suggested responses (stored on the ticket when ready)
+    """
+    return await _create_ticket_core(ticket_data, background_tasks, db)
+
+
 @router.get("/{ticket_id}", response_model=TicketResponse)
 async def get_ticket(
     ticket_id: UUID,
@@ -268,6 +417,21 @@ async def get_ticket(
     return TicketResponse.model_validate(ticket)
 
 
+# list_tickets query parameter -> (column, comparison) for simple filters
+_TICKET_LIST_FILTERS = {
+    "status": (Ticket.status, operator.eq),
+    "category": (Ticket.category, operator.eq),
+    "priority": (Ticket.priority, operator.eq),
+    "min_priority": (Ticket.priority, operator.ge),
+    "sentiment": (Ticket.sentiment, operator.eq),
+    "assigned_agent_id": (Ticket.assigned_agent_id, operator.eq),
+    "is_processed": (Ticket.is_processed, operator.eq),
+    "escalated": (Ticket.escalated, operator.eq),
+    "created_after": (Ticket.created_at, operator.ge),
+    "created_before": (Ticket.created_at, operator.le),
+}
+
+
 @router.get("", response_model=PaginatedResponse[TicketResponse])
 async def list_tickets(
     page: int = Query(1, ge=1),
@@ -285,39 +449,46 @@ async def list_tickets(
     created_before: Optional[datetime] = Query(None),
     sort_by: str = Query("created_at"),
     sort_order: str = Query("desc"),
+    after_created_at: Optional[datetime] = Query(None),
+    after_id: Optional[UUID] = Query(None),
     db: AsyncSession = Depends(get_async_db)
 ) -> PaginatedResponse[TicketResponse]:
     """
     List tickets with filtering and pagination.
+    
+    When sorting by ``created_at``, passing ``after_created_at`` and
+    ``after_id`` (echoed from ``next_cursor``) pages by keyset instead of
+    OFFSET. In that mode ``page`` is ignored and ``total`` counts the
+    tickets remaining after the cursor.
     """
     
-    # Build query
-    query = select(Ticket)
-    count_query = select(func.count(Ticket.id))
+    keyset = (
+        sort_by == "created_at"
+        and after_created_at is not None
+        and after_id is not None
+    )
+    
+    # Build query; the window count returns the filtered total with each row
+    query = select(Ticket, func.count().over().label("total_count"))
     
     # Apply filters
-    filters = []
-    
-    if status:
-        filters.append(Ticket.status == status)
-    if category:
-        filters.append(Ticket.category == category)
-    if priority:
-        filters.append(Ticket.priority == priority)
-    if min_priority:
-        filters.append(Ticket.priority >= min_priority)
-    if sentiment:
-        filters.append(Ticket.sentiment == sentiment)
-    if assigned_agent_id:
-        filters.append(Ticket.assigned_agent_id == assigned_agent_id)
-    if is_processed is not None:
-        filters.append(Ticket.is_processed == is_processed)
-    if escalated is not None:
-        filters.append(Ticket.escalated == escalated)
-    if created_after:
-        filters.append(Ticket.created_at >= created_after)
-    if created_before:
-        filters.append(Ticket.created_at <= created_before)
+    values = {
+        "status": status,
+        "category": category,
+        "priority": priority,
+        "min_priority": min_priority,
+        "sentiment": sentiment,
+        "assigned_agent_id": assigned_agent_id,
+        "is_processed": is_processed,
+        "escalated": escalated,
+        "created_after": created_after,
+        "created_before": created_before,
+    }
+    filters = [
+        compare(column, values[name])
+        for name, (column, compare) in _TICKET_LIST_FILTERS.items()
+        if values[name] is not None
+    ]
     if search:
         search_filter = or_(
             Ticket.subject.ilike(f"%{search}%"),
@@ -325,34 +496,60 @@ async def list_tickets(
         )
         filters.append(search_filter)
     
+    if keyset:
+        cursor = tuple_(Ticket.created_at, Ticket.id)
+        after = tuple_(after_created_at, after_id)
+        filters.append(cursor < after if sort_order == "desc" else cursor > after)
+        page = 1
+    
     if filters:
         query = query.where(and_(*filters))
-        count_query = count_query.where(and_(*filters))
-    
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
     
-    # Apply sorting
-    sort_column = getattr(Ticket, sort_by, Ticket.created_at)
+    # Apply sorting; id breaks created_at ties so the keyset is unique
+    sort_columns = [getattr(Ticket, sort_by, Ticket.created_at)]
+    if sort_by == "created_at":
+        sort_columns.append(Ticket.id)
     if sort_order == "desc":
-        query = query.order_by(sort_column.desc())
+        query = query.order_by(*(c.desc() for c in sort_columns))
     else:
-        query = query.order_by(sort_column.asc())
+        query = query.order_by(*(c.asc() for c in sort_columns))
     
     # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
+    if keyset:
+        query = query.limit(page_size)
+    else:
+        offset = (page - 1) * page_size
+        query = query.offset(offset).limit(page_size)
     
     # Execute query
-    result = await db.execute(query)
-    tickets = result.scalars().all()
+    rows = (await db.execute(query)).all()
+    tickets = [row[0] for row in rows]
+    
+    if rows:
+        total = rows[0].total_count
+    elif page > 1:
+        # Past the last page there are no rows to carry the count
+        count_query = select(func.count(Ticket.id))
+        if filters:
+            count_query = count_query.where(and_(*filters))
+        total = (await db.execute(count_query)).scalar()
+    else:
+        total = 0
+    
+    next_cursor = None
+    if sort_by == "created_at" and total > page * page_size:
+        last = tickets[-1]
+        next_cursor = {
+            "after_created_at": last.created_at.isoformat(),
+            "after_id": str(last.id)
+        }
     
     return PaginatedResponse.create(
-        items=[TicketResponse.model_validate(t) for t in tickets],
+        items=_ticket_list_adapter.validate_python(tickets, from_attributes=True),
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
@@ -407,21 +604,17 @@ async def reassign_ticket(
     
     # Update agent load if previously assigned
     if previous_agent_id:
-        prev_agent = await db.get(Agent, previous_agent_id)
-        if prev_agent and prev_agent.current_load > 0:
-            prev_agent.current_load -= 1
+        await _adjust_agent_load(db, previous_agent_id, -1)
     
     # Assign new agent
     if reassign_data.agent_id:
-        new_agent = await db.get(Agent, reassign_data.agent_id)
-        if not new_agent:
+        if not await _adjust_agent_load(db, reassign_data.agent_id, 1):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Agent {reassign_data.agent_id} not found"
             )
         
-        new_agent.current_load += 1
-        ticket.assigned_agent_id = new_agent.id
+        ticket.assigned_agent_id = reassign_data.agent_id
         ticket.assignment_reason = "manual_reassignment"
     else:
         ticket.assigned_agent_id = None
@@ -483,17 +676,20 @@ async def resolve_ticket(
             detail=f"Ticket {ticket_id} not found"
         )
     
+    now = datetime.utcnow()
     ticket.status = TicketStatus.RESOLVED
-    ticket.resolved_at = datetime.utcnow()
-    ticket.updated_at = datetime.utcnow()
+    ticket.resolved_at = now
+    ticket.updated_at = now
     
-    # Update agent load
+    # Update agent load and resolution counters
     if ticket.assigned_agent_id:
-        agent = await db.get(Agent, ticket.assigned_agent_id)
-        if agent and agent.current_load > 0:
-            agent.current_load -= 1
-            agent.tickets_resolved_today += 1
-            agent.total_tickets_resolved += 1
+        await _adjust_agent_load(
+            db,
+            ticket.assigned_agent_id,
+            -1,
+            tickets_resolved_today=Agent.tickets_resolved_today + 1,
+            total_tickets_resolved=Agent.total_tickets_resolved + 1
+        )
     
     await db.commit()
     await db.refresh(ticket)
@@ -510,39 +706,79 @@ async def bulk_update_tickets(
 ) -> TicketBulkUpdateResponse:
     """Bulk update multiple tickets."""
     
-    updated = 0
-    failed = 0
-    errors = []
-    
-    for ticket_id in bulk_data.ticket_ids:
-        try:
-            ticket = await db.get(Ticket, ticket_id)
-            
-            if not ticket:
-                failed += 1
-                errors.append({"ticket_id": str(ticket_id), "error": "not_found"})
-                continue
-            
-            # Apply updates
-            if bulk_data.status:
-                ticket.status = bulk_data.status
-            if bulk_data.category:
-                ticket.category = bulk_data.category
-            if bulk_data.priority:
-                ticket.priority = bulk_data.priority
-            if bulk_data.assigned_agent_id:
-                ticket.assigned_agent_id = bulk_data.assigned_agent_id
-            if bulk_data.add_tags:
-                ticket.tags = list(set(ticket.tags or []) | set(bulk_data.add_tags))
-            if bulk_data.remove_tags:
-                ticket.tags = [t for t in (ticket.tags or []) if t not in bulk_data.remove_tags]
-            
-            ticket.updated_at = datetime.utcnow()
-            updated += 1
+    # Values shared by every ticket
+    common = {"updated_at": datetime.utcnow()}
+    if bulk_data.status:
+        common["status"] = bulk_data.status
+    if bulk_data.category:
+        common["category"] = bulk_data.category
+    if bulk_data.priority:
+        common["priority"] = bulk_data.priority
+    if bulk_data.assigned_agent_id:
+        common["assigned_agent_id"] = bulk_data.assigned_agent_id
+    
+    change_tags = bool(bulk_data.add_tags or bulk_data.remove_tags)
+    
+    if change_tags or bulk_data.assigned_agent_id:
+        # Tag changes and reassignment depend on each ticket's current
+        # state: read it in one query first
+        result = await db.execute(
+            select(Ticket.id, Ticket.tags, Ticket.assigned_agent_id)
+            .where(Ticket.id.in_(bulk_data.ticket_ids))
+        )
+        rows = result.all()
+        found_ids = {row.id for row in rows}
+        
+        if change_tags:
+            # Every row goes through one executemany UPDATE
+            params = []
+            for ticket_id, tags, _ in rows:
+                tags = tags or []
+                if bulk_data.add_tags:
+                    tags = list(set(tags) | set(bulk_data.add_tags))
+                if bulk_data.remove_tags:
+                    tags = [t for t in tags if t not in bulk_data.remove_tags]
+                params.append({"id": ticket_id, "tags": tags, **common})
+            if params:
+                await db.execute(update(Ticket), params)
+        elif found_ids:
+            await db.execute(
+                update(Ticket)
+                .where(Ticket.id.in_(found_ids))
+                .values(**common)
+            )
+        
+        if bulk_data.assigned_agent_id:
+            # Net the load changes so each agent row is updated once
+            deltas: Dict[UUID, int] = {}
+            for row in rows:
+                if row.assigned_agent_id == bulk_data.assigned_agent_id:
+                    continue
+                if row.assigned_agent_id:
+                    deltas[row.assigned_agent_id] = deltas.get(row.assigned_agent_id, 0) - 1
+                deltas[bulk_data.assigned_agent_id] = deltas.get(bulk_data.assigned_agent_id, 0) + 1
             
-        except Exception as e:
-            failed += 1
-            errors.append({"ticket_id": str(ticket_id), "error": str(e)})
+            if bulk_data.assigned_agent_id in await _apply_agent_load_deltas(db, deltas):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Agent {bulk_data.assigned_agent_id} not found"
+                )
+    else:
+        result = await db.execute(
+            update(Ticket)
+            .where(Ticket.id.in_(bulk_data.ticket_ids))
+            .values(**common)
+            .returning(Ticket.id)
+        )
+        found_ids = set(result.scalars().all())
+    
+    errors = [
+        {"ticket_id": str(ticket_id), "error": "not_found"}
+        for ticket_id in bulk_data.ticket_ids
+        if ticket_id not in found_ids
+    ]
+    updated = len(bulk_data.ticket_ids) - len(errors)
+    failed = len(errors)
     
     await db.commit()
     
@@ -570,9 +806,7 @@ async def delete_ticket(
     
     # Update agent load if assigned
     if ticket.assigned_agent_id:
-        agent = await db.get(Agent, ticket.assigned_agent_id)
-        if agent and agent.current_load > 0:
-            agent.current_load -= 1
+        await _adjust_agent_load(db, ticket.assigned_agent_id, -1)
     
     await db.delete(ticket)
     await db.commit()
@@ -5,19 +5,70 @@ Handle incoming webhooks from external systems like Zendesk, Freshdesk, etc.
 """
 
 import hmac
-import hashlib
+import re
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, Header, BackgroundTasks, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
+from src.api.tickets import _create_ticket_core
 from src.database import get_async_db
 from src.config import settings
 from src.schemas.ticket import TicketCreate
 
 router = APIRouter()
 
+# Matches the address part of an email "From" header
+_EMAIL_RE = re.compile(r'[\w.\-]+@[\w.\-]+')
+
+
+@lru_cache(maxsize=8)
+def _hmac_template(secret: str, digestmod: str) -> hmac.HMAC:
+    """
+    Get a keyed HMAC with no data fed in yet.
+    
+    The key padding and inner/outer digest states are derived once per
+    secret; verifiers copy the template instead of re-keying per request.
+    """
+    return hmac.new(secret.encode(), digestmod=digestmod)
+
+
+def _verify_hmac_signature(
+    payload: bytes,
+    signature: str,
+    secret: str,
+    digestmod: str
+) -> bool:
+    """Check a hex HMAC signature, rejecting malformed ones before hashing."""
+    template = _hmac_template(secret, digestmod)
+    
+    # Length and charset are not secret, so checking them first leaks
+    # nothing; it also keeps non-ASCII input away from compare_digest
+    if not signature or len(signature) != template.digest_size * 2:
+        return False
+    try:
+        bytes.fromhex(signature)
+    except ValueError:
+        return False
+    
+    mac = template.copy()
+    mac.update(payload)
+    return hmac.compare_digest(signature.lower(), mac.hexdigest())
+
+
+def _parse_json(body: bytes) -> Dict[str, Any]:
+    """Decode a webhook payload, rejecting malformed JSON with a 400."""
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid JSON payload"
+        )
+
 
 def verify_zendesk_signature(
     payload: bytes,
@@ -25,12 +76,7 @@ def verify_zendesk_signature(
     secret: str
 ) -> bool:
     """Verify Zendesk webhook signature."""
-    expected = hmac.new(
-        secret.encode(),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
-    return hmac.compare_digest(signature, expected)
+    return _verify_hmac_signature(payload, signature, secret, "sha256")
 
 
 def verify_freshdesk_signature(
@@ -39,12 +85,7 @@ def verify_freshdesk_signature(
     secret: str
 ) -> bool:
     """Verify Freshdesk webhook signature."""
-    expected = hmac.new(
-        secret.encode(),
-        payload,
-        hashlib.sha1
-    ).hexdigest()
-    return hmac.compare_digest(signature, expected)
+    return _verify_hmac_signature(payload, signature, secret, "sha1")
 
 
 @router.post("/zendesk")
@@ -83,13 +124,7 @@ async def zendesk_webhook(
                 detail="Invalid webhook signature"
             )
     
-    try:
-        data = await request.json()
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid JSON payload"
-        )
+    data = _parse_json(body)
     
     logger.info(f"Received Zendesk webhook: {data.get('type', 'unknown')}")
     
@@ -99,9 +134,6 @@ async def zendesk_webhook(
     if event_type == "ticket.created" or event_type == "zen:event-type:ticket.created":
         ticket_data = data.get("ticket", data)
         
-        # Import here to avoid circular imports
-        from src.api.tickets import create_ticket
-        
         ticket_create = TicketCreate(
             content=ticket_data.get("description", ""),
             subject=ticket_data.get("subject"),
@@ -118,7 +150,7 @@ async def zendesk_webhook(
         )
         
         # Process ticket in background
-        result = await create_ticket(ticket_create, background_tasks, db)
+        result = await _create_ticket_core(ticket_create, background_tasks, db)
         
         return {
             "status": "accepted",
@@ -158,13 +190,7 @@ async def freshdesk_webhook(
     - Ticket updated
     """
     
-    try:
-        data = await request.json()
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid JSON payload"
-        )
+    data = _parse_json(await request.body())
     
     logger.info(f"Received Freshdesk webhook")
     
@@ -173,8 +199,6 @@ async def freshdesk_webhook(
     
     # Check if this is a new ticket
     if ticket_data.get("ticket_id"):
-        from src.api.tickets import create_ticket
-        
         ticket_create = TicketCreate(
             content=ticket_data.get("ticket_description", ""),
             subject=ticket_data.get("ticket_subject"),
@@ -190,7 +214,7 @@ async def freshdesk_webhook(
             }
         )
         
-        result = await create_ticket(ticket_create, background_tasks, db)
+        result = await _create_ticket_core(ticket_create, background_tasks, db)
         
         return {
             "status": "accepted",
@@ -229,13 +253,7 @@ async def generic_webhook(
     ```
     """
     
-    try:
-        data = await request.json()
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid JSON payload"
-        )
+    data = _parse_json(await request.body())
     
     # Validate required fields
     if not data.get("content"):
@@ -246,8 +264,6 @@ async def generic_webhook(
     
     logger.info(f"Received generic webhook from {data.get('source', 'unknown')}")
     
-    from src.api.tickets import create_ticket
-    
     ticket_create = TicketCreate(
         content=data["content"],
         subject=data.get("subject"),
@@ -263,7 +279,7 @@ async def generic_webhook(
         custom_fields=data.get("custom_fields", {})
     )
     
-    result = await create_ticket(ticket_create, background_tasks, db)
+    result = await _create_ticket_core(ticket_create, background_tasks, db)
     
     return {
         "status": "accepted",
@@ -296,8 +312,8 @@ async def email_webhook(
     
     try:
         # Try JSON first
-        data = await request.json()
-    except Exception:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
         # Fall back to form data
         form = await request.form()
         data = dict(form)
@@ -321,8 +337,7 @@ async def email_webhook(
         )
     
     # Parse sender email
-    import re
-    email_match = re.search(r'[\w\.-]+@[\w\.-]+', sender or "")
+    email_match = _EMAIL_RE.search(sender or "")
     customer_email = email_match.group() if email_match else None
     
     # Extract name from sender
@@ -332,8 +347,6 @@ async def email_webhook(
     
     logger.info(f"Received email webhook from {customer_email}")
     
-    from src.api.tickets import create_ticket
-    
     ticket_create = TicketCreate(
         content=body,
         subject=subject,
@@ -345,7 +358,7 @@ async def email_webhook(
         channel="email"
     )
     
-    result = await create_ticket(ticket_create, background_tasks, db)
+    result = await _create_ticket_core(ticket_create, background_tasks, db)
     
     return {
         "status": "accepted",
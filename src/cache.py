@@ -0,0 +1,112 @@
+"""
+Redis cache management.
+
+This module provides:
+- A shared async Redis client backed by a single connection pool
+- Fail-open helpers for reading, writing and invalidating cache keys
+
+Cache keys follow the ``{domain}:{identifier}`` convention,
+e.g. ``routing_rules:list:0:all``.
+"""
+
+import asyncio
+from typing import Optional
+
+import redis.asyncio as redis
+from loguru import logger
+
+from src.config import settings
+
+# -----------------------------------------------------------------------------
+# Shared Client
+# -----------------------------------------------------------------------------
+
+# Fail fast when Redis is unreachable; callers treat errors as cache misses
+REDIS_SOCKET_TIMEOUT = 1.0
+
+_redis_client: Optional[redis.Redis] = None
+_redis_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_redis() -> redis.Redis:
+    """
+    Get the shared Redis client.
+
+    The client is created on first use and reuses one connection pool.
+    Pooled connections belong to the event loop that opened them, so a
+    new client is created when called from a different loop (Celery tasks
+    run each job in a fresh loop).
+
+    Returns:
+        redis.Redis: Async Redis client
+    """
+    global _redis_client, _redis_client_loop
+    loop = asyncio.get_running_loop()
+    if _redis_client is None or _redis_client_loop is not loop:
+        _redis_client = redis.from_url(
+            settings.redis_url,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+        _redis_client_loop = loop
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client and its connection pool."""
+    global _redis_client, _redis_client_loop
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+        _redis_client_loop = None
+
+
+# -----------------------------------------------------------------------------
+# Cache Helpers
+# -----------------------------------------------------------------------------
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Get a cached value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached bytes, or None on a miss or if Redis is unavailable
+    """
+    try:
+        return await get_redis().get(key)
+    except Exception as e:
+        logger.warning(f"Cache read error for {key}: {e}")
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int) -> None:
+    """
+    Store a value with an expiry.
+
+    Args:
+        key: Cache key
+        value: Serialized value
+        ttl: Time to live in seconds
+    """
+    try:
+        await get_redis().setex(key, ttl, value)
+    except Exception as e:
+        logger.warning(f"Cache write error for {key}: {e}")
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Invalidate cached values.
+
+    Args:
+        keys: Cache keys to delete
+    """
+    if not keys:
+        return
+    try:
+        await get_redis().delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache invalidation error: {e}")
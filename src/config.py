@@ -5,12 +5,16 @@ This module provides centralized configuration for the application,
 loading values from environment variables with sensible defaults.
 """
 
-from functools import lru_cache
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import Optional, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Allowed values for the validated settings below
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_APP_ENVS = frozenset({"development", "staging", "production", "testing"})
+
 
 class Settings(BaseSettings):
     """
@@ -25,6 +29,8 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Settings are shared process-wide; reject accidental mutation
+        frozen=True,
     )
     
     # -------------------------------------------------------------------------
@@ -63,10 +69,10 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed CORS origins"
     )
     
-    @property
-    def cors_origins(self) -> List[str]:
-        """Parse allowed origins into a list."""
-        return [origin.strip() for origin in self.allowed_origins.split(",")]
+    @cached_property
+    def cors_origins(self) -> Tuple[str, ...]:
+        """Parse allowed origins once; the tuple keeps the cached value immutable."""
+        return tuple(origin.strip() for origin in self.allowed_origins.split(","))
     
     # -------------------------------------------------------------------------
     # Database Settings
@@ -76,13 +82,29 @@ class Settings(BaseSettings):
         description="PostgreSQL connection string"
     )
     database_pool_size: int = Field(
-        default=10,
+        default=20,
         description="Database connection pool size"
     )
     database_max_overflow: int = Field(
-        default=20,
+        default=10,
         description="Maximum overflow connections"
     )
+    database_pool_timeout: int = Field(
+        default=5,
+        description="Seconds to wait for a pooled connection before failing"
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are replaced"
+    )
+    database_pool_pre_ping: bool = Field(
+        default=False,
+        description="Ping connections on checkout (costs a round-trip per checkout)"
+    )
+    database_keepalive_idle: int = Field(
+        default=30,
+        description="Idle seconds before TCP keepalive probes on PostgreSQL connections"
+    )
     
     # -------------------------------------------------------------------------
     # Redis Settings
@@ -131,8 +153,8 @@ class Settings(BaseSettings):
         default="en",
         description="Default language for processing (tr, en)"
     )
-    supported_languages: List[str] = Field(
-        default=["tr", "en"],
+    supported_languages: Tuple[str, ...] = Field(
+        default=("tr", "en"),
         description="List of supported languages"
     )
     
@@ -143,8 +165,8 @@ class Settings(BaseSettings):
         default=0.7,
         description="Minimum confidence for classification"
     )
-    default_categories: List[str] = Field(
-        default=[
+    default_categories: Tuple[str, ...] = Field(
+        default=(
             "technical_issue",
             "billing_question",
             "feature_request",
@@ -153,7 +175,7 @@ class Settings(BaseSettings):
             "return_refund",
             "general_inquiry",
             "complaint"
-        ],
+        ),
         description="Default ticket categories"
     )
     
@@ -264,20 +286,18 @@ class Settings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is valid."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v = v.upper()
-        if v not in valid_levels:
-            raise ValueError(f"Log level must be one of: {valid_levels}")
+        if v not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of: {sorted(_VALID_LOG_LEVELS)}")
         return v
     
     @field_validator("app_env")
     @classmethod
     def validate_app_env(cls, v: str) -> str:
         """Validate application environment."""
-        valid_envs = ["development", "staging", "production", "testing"]
         v = v.lower()
-        if v not in valid_envs:
-            raise ValueError(f"App env must be one of: {valid_envs}")
+        if v not in _VALID_APP_ENVS:
+            raise ValueError(f"App env must be one of: {sorted(_VALID_APP_ENVS)}")
         return v
 
 
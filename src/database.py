@@ -7,12 +7,21 @@ This module provides:
 - Dependency injection for FastAPI
 """
 
+import warnings
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from src.config import settings
 
@@ -20,64 +29,124 @@ from src.config import settings
 # Database URL handling
 # -----------------------------------------------------------------------------
 
-def get_async_database_url(url: str) -> str:
+# Parsed once; both engines derive their URL from it by swapping the driver
+_DATABASE_URL = make_url(settings.database_url)
+
+
+def get_async_database_url(url: URL) -> URL:
     """Convert standard PostgreSQL URL to async version."""
-    if url.startswith("postgresql://"):
-        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.drivername == "postgresql":
+        return url.set(drivername="postgresql+asyncpg")
     return url
 
 
-def get_sync_database_url(url: str) -> str:
+def get_sync_database_url(url: URL) -> URL:
     """Ensure URL uses sync driver."""
-    if "asyncpg" in url:
-        return url.replace("postgresql+asyncpg://", "postgresql://")
+    if url.drivername == "postgresql+asyncpg":
+        return url.set(drivername="postgresql")
     return url
 
 
+def get_keepalive_connect_args(url: URL) -> dict:
+    """
+    Get driver arguments enabling TCP keepalives on PostgreSQL connections.
+    
+    Keepalives detect dead connections without the extra round-trip that
+    ``pool_pre_ping`` adds to every checkout.
+    """
+    idle = settings.database_keepalive_idle
+    if url.drivername == "postgresql+asyncpg":
+        return {"server_settings": {"tcp_keepalives_idle": str(idle)}}
+    if url.get_backend_name() == "postgresql":
+        return {"keepalives": 1, "keepalives_idle": idle}
+    return {}
+
+
 # -----------------------------------------------------------------------------
 # Sync Engine and Session (for Alembic and sync operations)
 # -----------------------------------------------------------------------------
 
-sync_engine = create_engine(
-    get_sync_database_url(settings.database_url),
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,
-    echo=settings.debug,
-)
-
-SyncSessionLocal = sessionmaker(
-    bind=sync_engine,
+# Session options shared by the sync and async session factories
+_SESSION_KWARGS = dict(
     autocommit=False,
     autoflush=False,
     expire_on_commit=False,
 )
 
+# Engines are created on first use, so importing this module neither loads
+# a DB driver nor builds a pool the process may never need (the API only
+# uses the async engine, the Celery workers only the sync one)
+
+@lru_cache(maxsize=1)
+def get_sync_engine() -> Engine:
+    """Get the shared sync engine, creating it on first use."""
+    url = get_sync_database_url(_DATABASE_URL)
+    return create_engine(
+        url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        connect_args=get_keepalive_connect_args(url),
+        echo=settings.debug,
+    )
+
+
+@lru_cache(maxsize=1)
+def _sync_sessionmaker() -> sessionmaker:
+    return sessionmaker(bind=get_sync_engine(), **_SESSION_KWARGS)
+
+
+def SyncSessionLocal() -> Session:
+    """Create a sync session bound to the shared sync engine."""
+    return _sync_sessionmaker()()
+
+
 # -----------------------------------------------------------------------------
 # Async Engine and Session (for FastAPI)
 # -----------------------------------------------------------------------------
 
-async_engine = create_async_engine(
-    get_async_database_url(settings.database_url),
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,
-    echo=settings.debug,
-)
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Get the shared async engine, creating it on first use."""
+    url = get_async_database_url(_DATABASE_URL)
+    return create_async_engine(
+        url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        connect_args=get_keepalive_connect_args(url),
+        # Hand out the most recently returned connection so bursts reuse warm
+        # connections (and their prepared statements) while idle extras age out
+        pool_use_lifo=True,
+        echo=settings.debug,
+    )
+
+
+@lru_cache(maxsize=1)
+def _async_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        **_SESSION_KWARGS,
+    )
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Create an async session bound to the shared async engine."""
+    return _async_sessionmaker()()
 
-AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-)
 
 # -----------------------------------------------------------------------------
 # Base Model
 # -----------------------------------------------------------------------------
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base class for all ORM models."""
+
 
 # -----------------------------------------------------------------------------
 # Dependency Injection
@@ -87,14 +156,19 @@ def get_sync_db() -> Generator[Session, None, None]:
     """
     Get synchronous database session.
     
-    Usage:
-        @app.get("/")
-        def endpoint(db: Session = Depends(get_sync_db)):
-            ...
+    Deprecated for request handlers: a sync session blocks a threadpool
+    worker for every query and builds the sync engine next to the async
+    one. Routes should depend on ``get_async_db``; scripts and workers
+    can use ``SyncSessionLocal()`` directly.
     
     Yields:
         Session: SQLAlchemy session
     """
+    warnings.warn(
+        "get_sync_db is deprecated; depend on get_async_db in routes",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     db = SyncSessionLocal()
     try:
         yield db
@@ -148,19 +222,43 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
 # Database Utilities
 # -----------------------------------------------------------------------------
 
+def dialect_insert(session: AsyncSession):
+    """
+    Get the dialect-specific ``insert()`` construct for a session.
+    
+    The PostgreSQL and SQLite variants support
+    ``on_conflict_do_nothing()`` / ``on_conflict_do_update()``.
+    
+    Args:
+        session: Session whose bind determines the dialect
+        
+    Returns:
+        The ``insert`` function for the session's dialect
+    """
+    if session.bind.dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
+
+
 async def init_db() -> None:
     """
     Initialize database by creating all tables.
     
     Note: In production, use Alembic migrations instead.
     """
-    async with async_engine.begin() as conn:
+    async with get_async_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
 async def close_db() -> None:
     """Close database connections."""
-    await async_engine.dispose()
+    # Nothing to dispose if the engine was never created
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
+# Built once and reused for every connectivity check
+_PING_QUERY = text("SELECT 1")
 
 
 async def check_db_connection() -> bool:
@@ -172,7 +270,7 @@ async def check_db_connection() -> bool:
     """
     try:
         async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
+            await session.execute(_PING_QUERY)
             return True
     except Exception:
         return False
@@ -2,14 +2,38 @@
 External System Integrations
 
 Provides integration clients for external helpdesk systems.
+
+The vendor clients pull in httpx, so they are imported
+on first access rather than with the package.
 """
 
-from src.integrations.base import BaseIntegration
-from src.integrations.zendesk import ZendeskClient
-from src.integrations.freshdesk import FreshdeskClient
+from importlib import import_module
+from typing import Any
+
+from src.integrations.base import BaseIntegration, CachingIntegration
+
+# Lazily exported name -> defining submodule
+_LAZY_EXPORTS = {
+    "ZendeskClient": "src.integrations.zendesk",
+    "FreshdeskClient": "src.integrations.freshdesk",
+}
 
 __all__ = [
     "BaseIntegration",
+    "CachingIntegration",
     "ZendeskClient",
     "FreshdeskClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -2,14 +2,26 @@
 Base Integration Class
 
 Abstract base class for external system integrations.
+
+This module must stay free of vendor and HTTP client imports, so that
+code can type-hint ExternalTicket or BaseIntegration without loading
+httpx or any helpdesk client.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+)
+from dataclasses import asdict, dataclass, field
+
+import orjson
 
 
-@dataclass
+# Tickets are never compared or logged whole, so skip __eq__/__repr__
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class ExternalTicket:
     """Represents a ticket from an external system."""
     
@@ -22,8 +34,48 @@ class ExternalTicket:
     requester_name: Optional[str]
     created_at: str
     updated_at: Optional[str]
-    tags: List[str]
-    custom_fields: Dict[str, Any]
+    # () is a singleton, so untagged tickets share one empty tuple
+    tags: Tuple[str, ...] = ()
+    custom_fields: Mapping[str, Any] = field(default_factory=dict)
+
+
+# Upper bound on pages requested at once, to stay clear of vendor rate limits
+MAX_PAGE_CONCURRENCY = 10
+
+
+async def iter_pages(
+    fetch_page: Callable[[int], Awaitable[List[ExternalTicket]]],
+    page_size: int,
+    concurrency: int = 4,
+    max_pages: Optional[int] = None
+) -> AsyncIterator[ExternalTicket]:
+    """
+    Yield tickets from a paginated endpoint, fetching pages concurrently.
+    
+    Pages are requested ``concurrency`` at a time and yielded in order,
+    so callers can process one wave while nothing else is in flight.
+    Iteration stops at the first short page or after ``max_pages``.
+    
+    Args:
+        fetch_page: Coroutine function returning the tickets of a 1-based page
+        page_size: Tickets per full page
+        concurrency: Pages requested at once
+        max_pages: Last page the endpoint serves, if limited
+    """
+    page = 1
+    while max_pages is None or page <= max_pages:
+        last = page + concurrency - 1
+        if max_pages is not None:
+            last = min(last, max_pages)
+        
+        pages = await asyncio.gather(*(fetch_page(n) for n in range(page, last + 1)))
+        for tickets in pages:
+            for ticket in tickets:
+                yield ticket
+            if len(tickets) < page_size:
+                return
+        
+        page = last + 1
 
 
 class BaseIntegration(ABC):
@@ -77,6 +129,28 @@ class BaseIntegration(ABC):
         """
         pass
     
+    @abstractmethod
+    def stream_tickets(
+        self,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        batch_size: int = 100,
+        concurrency: int = 4
+    ) -> AsyncIterator[ExternalTicket]:
+        """
+        Iterate over all matching tickets, fetching pages concurrently.
+        
+        Args:
+            status: Filter by status
+            since: Get tickets created/updated since this datetime
+            batch_size: Tickets requested per page
+            concurrency: Pages fetched at once
+            
+        Yields:
+            ExternalTicket objects, in page order
+        """
+        pass
+    
     @abstractmethod
     async def create_ticket(
         self,
@@ -152,7 +226,168 @@ class BaseIntegration(ABC):
         """
         pass
     
+    async def reply_and_resolve(
+        self,
+        ticket_id: str,
+        content: str,
+        public: bool = True,
+        author_id: Optional[str] = None
+    ) -> bool:
+        """
+        Add a comment and resolve the ticket.
+        
+        Both requests are sent at once rather than one after the other.
+        
+        Args:
+            ticket_id: External ticket ID
+            content: Comment content
+            public: Whether comment is public
+            author_id: Comment author ID
+            
+        Returns:
+            bool: True if both the comment and the update succeeded
+        """
+        commented, resolved = await asyncio.gather(
+            self.add_comment(ticket_id, content, public=public, author_id=author_id),
+            self.update_ticket(ticket_id, status="resolved")
+        )
+        return commented and resolved
+    
     @abstractmethod
     async def close(self) -> None:
         """Close any open connections."""
         pass
+
+
+# In-process ticket copies are served as-is while fresh, and served while a
+# background refresh runs until stale
+TICKET_FRESH_SECONDS = 15
+TICKET_STALE_SECONDS = 60
+LOCAL_TICKET_CACHE_SIZE = 4096
+
+# Cache key -> (ticket, monotonic time fetched), least recently used first
+_local_tickets: "OrderedDict[str, Tuple[ExternalTicket, float]]" = OrderedDict()
+
+# Cache key -> in-flight load, shared by concurrent lookups of one ticket
+_ticket_loads: Dict[str, "asyncio.Task[Optional[ExternalTicket]]"] = {}
+
+
+def _encode_ticket(ticket: ExternalTicket) -> bytes:
+    """Serialize a ticket for Redis."""
+    data = asdict(ticket)
+    # As [key, value] pairs, so non-string keys (Zendesk field ids are
+    # ints) keep their type instead of coming back as JSON object keys
+    data["custom_fields"] = list(ticket.custom_fields.items())
+    return orjson.dumps(data)
+
+
+def _decode_ticket(raw: bytes) -> ExternalTicket:
+    """Rebuild a ticket serialized by ``_encode_ticket``."""
+    data = orjson.loads(raw)
+    data["tags"] = tuple(data["tags"])
+    data["custom_fields"] = dict(data["custom_fields"])
+    return ExternalTicket(**data)
+
+
+class CachingIntegration(BaseIntegration):
+    """
+    Integration with a read-through cache in front of ``get_ticket``.
+    
+    Lookups go to a small in-process stale-while-revalidate cache, then
+    to Redis, then to the external system. Concurrent misses for one
+    ticket share a single load. Subclasses call ``invalidate_ticket``
+    after changing a ticket so the next lookup goes back to the external
+    system. The cache fails open: Redis errors fall through to
+    ``get_ticket``.
+    
+    Caching is opt-in: ``get_ticket`` always goes to the external system,
+    callers that can accept a copy up to TICKET_STALE_SECONDS old use
+    ``get_ticket_cached``.
+    """
+    
+    def _ticket_cache_key(self, ticket_id: str) -> str:
+        return f"external_ticket:{type(self).__name__}:{ticket_id}"
+    
+    async def get_ticket_cached(self, ticket_id: str) -> Optional[ExternalTicket]:
+        """
+        Get a single ticket by ID, serving repeat lookups from cache.
+        
+        Args:
+            ticket_id: External ticket ID
+            
+        Returns:
+            ExternalTicket or None if not found
+        """
+        key = self._ticket_cache_key(ticket_id)
+        
+        entry = _local_tickets.get(key)
+        if entry is not None:
+            ticket, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age < TICKET_FRESH_SECONDS:
+                _local_tickets.move_to_end(key)
+                return ticket
+            if age < TICKET_STALE_SECONDS:
+                if key not in _ticket_loads:
+                    self._start_load(key, ticket_id, refresh=True)
+                _local_tickets.move_to_end(key)
+                return ticket
+        
+        load = _ticket_loads.get(key) or self._start_load(key, ticket_id)
+        return await asyncio.shield(load)
+    
+    def _start_load(
+        self,
+        key: str,
+        ticket_id: str,
+        refresh: bool = False
+    ) -> "asyncio.Task[Optional[ExternalTicket]]":
+        """Start loading a ticket, registering the load for other callers."""
+        load = asyncio.create_task(self._load_ticket(key, ticket_id, refresh))
+        _ticket_loads[key] = load
+        load.add_done_callback(lambda _: _ticket_loads.pop(key, None))
+        return load
+    
+    async def _load_ticket(
+        self,
+        key: str,
+        ticket_id: str,
+        refresh: bool
+    ) -> Optional[ExternalTicket]:
+        """Load a ticket from Redis or the external system into the local cache."""
+        # Imported here to keep this module free of client dependencies
+        from src.cache import cache_get, cache_set
+        from src.config import settings
+        
+        try:
+            cached = None if refresh else await cache_get(key)
+            if cached is not None:
+                ticket = _decode_ticket(cached)
+            else:
+                ticket = await self.get_ticket(ticket_id)
+                if ticket is not None:
+                    await cache_set(key, _encode_ticket(ticket), settings.redis_cache_ttl)
+        except Exception:
+            if refresh:
+                # Nobody awaits a background refresh; keep serving the stale copy
+                return None
+            raise
+        
+        if ticket is None:
+            _local_tickets.pop(key, None)
+            return None
+        
+        _local_tickets[key] = (ticket, time.monotonic())
+        _local_tickets.move_to_end(key)
+        if len(_local_tickets) > LOCAL_TICKET_CACHE_SIZE:
+            _local_tickets.popitem(last=False)
+        
+        return ticket
+    
+    async def invalidate_ticket(self, ticket_id: str) -> None:
+        """Drop the cached copies of a ticket."""
+        from src.cache import cache_delete
+        
+        key = self._ticket_cache_key(ticket_id)
+        _local_tickets.pop(key, None)
+        await cache_delete(key)
@@ -4,19 +4,25 @@ Freshdesk Integration
 Client for Freshdesk API v2.
 """
 
-from typing import Dict, List, Optional, Any
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Any
 from datetime import datetime
-import base64
 
 import httpx
+import orjson
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config import settings
-from src.integrations.base import BaseIntegration, ExternalTicket
+from src.integrations.base import (
+    MAX_PAGE_CONCURRENCY,
+    CachingIntegration,
+    ExternalTicket,
+    iter_pages,
+)
+from src.integrations.http import request_with_retry
 
 
-class FreshdeskClient(BaseIntegration):
+class FreshdeskClient(CachingIntegration):
     """
     Freshdesk API client.
     
@@ -44,6 +50,15 @@ class FreshdeskClient(BaseIntegration):
         "closed": 5
     }
     
+    # Our status -> search filter clause
+    STATUS_FILTERS = {
+        status: f"status:{code}" for status, code in STATUS_REVERSE_MAP.items()
+    }
+    
+    # The search endpoint ignores per_page and serves at most 10 pages
+    SEARCH_PAGE_SIZE = 30
+    SEARCH_MAX_PAGES = 10
+    
     # Freshdesk priority codes
     PRIORITY_MAP = {
         1: 1,  # Low
@@ -52,6 +67,9 @@ class FreshdeskClient(BaseIntegration):
         4: 4   # Urgent
     }
     
+    # Our priority (clamped to 0-5) -> Freshdesk priority code
+    PRIORITY_REVERSE = (1, 1, 1, 2, 3, 4)
+    
     def __init__(
         self,
         domain: Optional[str] = None,
@@ -71,139 +89,178 @@ class FreshdeskClient(BaseIntegration):
             logger.warning("Freshdesk credentials not fully configured")
         
         self.base_url = f"https://{self.domain}.freshdesk.com/api/v2"
-        self._client: Optional[httpx.AsyncClient] = None
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
         
-        if self._client is None:
-            # Freshdesk uses API key as username with any password
-            auth = base64.b64encode(f"{self.api_key}:X".encode()).decode()
-            
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers={
-                    "Authorization": f"Basic {auth}",
-                    "Content-Type": "application/json"
-                },
-                timeout=30.0
-            )
+        # Freshdesk uses API key as username with any password
+        self._auth = httpx.BasicAuth(self.api_key or "", "X")
+    
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send an authenticated request, retrying transient failures."""
         
-        return self._client
+        return await request_with_retry(
+            method,
+            f"{self.base_url}{path}",
+            auth=self._auth,
+            **kwargs
+        )
     
     async def authenticate(self) -> bool:
         """Test authentication with Freshdesk."""
         
         try:
-            client = await self._get_client()
-            response = await client.get("/agents/me")
+            response = await self._request("GET", "/agents/me")
             response.raise_for_status()
             
-            agent = response.json()
-            logger.info(f"Authenticated with Freshdesk as {agent.get('contact', {}).get('email')}")
+            agent = orjson.loads(response.content)
+            logger.info("Authenticated with Freshdesk as {}", agent.get("contact", {}).get("email"))
             
             return True
             
         except Exception as e:
-            logger.error(f"Freshdesk authentication failed: {e}")
+            logger.error("Freshdesk authentication failed: {}", e)
             return False
     
     def _parse_ticket(self, data: Dict) -> ExternalTicket:
         """Parse Freshdesk ticket data into ExternalTicket."""
         
+        requester = data.get("requester") or {}
         return ExternalTicket(
             id=str(data.get("id")),
             subject=data.get("subject"),
             content=data.get("description_text", data.get("description", "")),
             status=self.STATUS_MAP.get(data.get("status"), "open"),
             priority=data.get("priority", 2),
-            requester_email=data.get("requester", {}).get("email"),
-            requester_name=data.get("requester", {}).get("name"),
+            requester_email=requester.get("email"),
+            requester_name=requester.get("name"),
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
-            tags=data.get("tags", []),
+            tags=tuple(data.get("tags") or ()),
             custom_fields=data.get("custom_fields", {})
         )
     
+    def _parse_many(self, rows: List[Dict]) -> List[ExternalTicket]:
+        """Parse a page of ticket data into ExternalTickets."""
+        
+        parse = self._parse_ticket
+        return [parse(row) for row in rows]
+    
     def _map_priority_to_freshdesk(self, priority: int) -> int:
         """Map our 1-5 priority to Freshdesk 1-4 scale."""
-        if priority >= 5:
-            return 4  # Urgent
-        elif priority >= 4:
-            return 3  # High
-        elif priority >= 3:
-            return 2  # Medium
-        else:
-            return 1  # Low
+        return self.PRIORITY_REVERSE[min(max(priority, 0), 5)]
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def get_ticket(self, ticket_id: str) -> Optional[ExternalTicket]:
         """Get a single ticket from Freshdesk."""
         
         try:
-            client = await self._get_client()
-            response = await client.get(f"/tickets/{ticket_id}")
+            response = await self._request("GET", f"/tickets/{ticket_id}")
             
             if response.status_code == 404:
                 return None
             
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             return self._parse_ticket(data)
             
         except Exception as e:
-            logger.error(f"Failed to get Freshdesk ticket {ticket_id}: {e}")
+            logger.error("Failed to get Freshdesk ticket {}: {}", ticket_id, e)
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
+    def _search_query(self, status: Optional[str], since: Optional[str]) -> Optional[str]:
+        """Build the filter query, or None to use the plain list endpoint."""
+        
+        status_filter = self.STATUS_FILTERS.get(status) if status else None
+        if not since:
+            return status_filter
+        
+        since_filter = f"updated_at:>'{since}'"
+        if status_filter:
+            return f"{status_filter} AND {since_filter}"
+        return since_filter
+    
+    async def _fetch_ticket_page(
+        self,
+        query: Optional[str],
+        page: int,
+        per_page: int
+    ) -> List[ExternalTicket]:
+        """Fetch one page of tickets from the list or search endpoint."""
+        
+        params = {"page": page, "per_page": per_page}
+        
+        if query:
+            params["query"] = query
+            endpoint = "/search/tickets"
+        else:
+            endpoint = "/tickets"
+        
+        response = await self._request("GET", endpoint, params=params)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        
+        # Handle search vs list response format
+        if "results" in data:
+            return self._parse_many(data.get("results", []))
+        return self._parse_many(data)
+    
     async def get_tickets(
         self,
         status: Optional[str] = None,
         since: Optional[str] = None,
         limit: int = 100
     ) -> List[ExternalTicket]:
-        """Get tickets from Freshdesk."""
+        """Get tickets from Freshdesk, fetching the pages needed concurrently."""
         
+        if limit < 1:
+            return []
+        
+        per_page = min(limit, 100)
+        if self._search_query(status, since):
+            per_page = self.SEARCH_PAGE_SIZE
+        pages = -(-limit // per_page)
+        
+        tickets: List[ExternalTicket] = []
         try:
-            client = await self._get_client()
-            
-            params = {"per_page": min(limit, 100)}
-            
-            # Build filter query
-            filters = []
-            if status:
-                status_code = self.STATUS_REVERSE_MAP.get(status)
-                if status_code:
-                    filters.append(f"status:{status_code}")
-            
-            if since:
-                filters.append(f"updated_at:>'{since}'")
-            
-            if filters:
-                params["query"] = " AND ".join(filters)
-                endpoint = "/search/tickets"
-            else:
-                endpoint = "/tickets"
-            
-            response = await client.get(endpoint, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Handle search vs list response format
-            if "results" in data:
-                tickets = [self._parse_ticket(t) for t in data.get("results", [])]
-            else:
-                tickets = [self._parse_ticket(t) for t in data]
-            
-            return tickets
-            
+            async with aclosing(self.stream_tickets(
+                status,
+                since,
+                batch_size=per_page,
+                concurrency=min(pages, MAX_PAGE_CONCURRENCY)
+            )) as stream:
+                async for ticket in stream:
+                    tickets.append(ticket)
+                    if len(tickets) >= limit:
+                        break
         except Exception as e:
-            logger.error(f"Failed to get Freshdesk tickets: {e}")
+            logger.error("Failed to get Freshdesk tickets: {}", e)
             raise
+        
+        return tickets
+    
+    async def stream_tickets(
+        self,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        batch_size: int = 100,
+        concurrency: int = 4
+    ) -> AsyncIterator[ExternalTicket]:
+        """Iterate over all Freshdesk tickets, fetching pages concurrently."""
+        
+        query = self._search_query(status, since)
+        if query:
+            # Search returns fixed-size pages and only the first few of them
+            per_page, max_pages = self.SEARCH_PAGE_SIZE, self.SEARCH_MAX_PAGES
+        else:
+            per_page, max_pages = min(batch_size, 100), None
+        
+        async for ticket in iter_pages(
+            lambda page: self._fetch_ticket_page(query, page, per_page),
+            page_size=per_page,
+            concurrency=concurrency,
+            max_pages=max_pages
+        ):
+            yield ticket
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def create_ticket(
         self,
         subject: str,
@@ -216,8 +273,6 @@ class FreshdeskClient(BaseIntegration):
         """Create a new ticket in Freshdesk."""
         
         try:
-            client = await self._get_client()
-            
             ticket_data = {
                 "subject": subject,
                 "description": content,
@@ -233,21 +288,20 @@ class FreshdeskClient(BaseIntegration):
             if custom_fields:
                 ticket_data["custom_fields"] = custom_fields
             
-            response = await client.post("/tickets", json=ticket_data)
+            response = await self._request("POST", "/tickets", json=ticket_data)
             response.raise_for_status()
             
-            created = response.json()
+            created = orjson.loads(response.content)
             ticket_id = str(created.get("id"))
             
-            logger.info(f"Created Freshdesk ticket: {ticket_id}")
+            logger.info("Created Freshdesk ticket: {}", ticket_id)
             
             return ticket_id
             
         except Exception as e:
-            logger.error(f"Failed to create Freshdesk ticket: {e}")
+            logger.error("Failed to create Freshdesk ticket: {}", e)
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def update_ticket(
         self,
         ticket_id: str,
@@ -262,8 +316,6 @@ class FreshdeskClient(BaseIntegration):
         """Update a ticket in Freshdesk."""
         
         try:
-            client = await self._get_client()
-            
             ticket_data: Dict[str, Any] = {}
             
             if status:
@@ -292,21 +344,22 @@ class FreshdeskClient(BaseIntegration):
             if not ticket_data:
                 return True
             
-            response = await client.put(
+            response = await self._request(
+                "PUT",
                 f"/tickets/{ticket_id}",
                 json=ticket_data
             )
             response.raise_for_status()
             
-            logger.info(f"Updated Freshdesk ticket: {ticket_id}")
+            logger.info("Updated Freshdesk ticket: {}", ticket_id)
+            await self.invalidate_ticket(ticket_id)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to update Freshdesk ticket {ticket_id}: {e}")
+            logger.error("Failed to update Freshdesk ticket {}: {}", ticket_id, e)
             return False
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def add_comment(
         self,
         ticket_id: str,
@@ -317,8 +370,6 @@ class FreshdeskClient(BaseIntegration):
         """Add a note/reply to a Freshdesk ticket."""
         
         try:
-            client = await self._get_client()
-            
             if public:
                 # Add a reply
                 endpoint = f"/tickets/{ticket_id}/reply"
@@ -334,20 +385,17 @@ class FreshdeskClient(BaseIntegration):
             if author_id:
                 note_data["user_id"] = int(author_id)
             
-            response = await client.post(endpoint, json=note_data)
+            response = await self._request("POST", endpoint, json=note_data)
             response.raise_for_status()
             
-            logger.info(f"Added {'reply' if public else 'note'} to Freshdesk ticket: {ticket_id}")
+            logger.info("Added {} to Freshdesk ticket: {}", "reply" if public else "note", ticket_id)
+            await self.invalidate_ticket(ticket_id)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to add comment to Freshdesk ticket {ticket_id}: {e}")
+            logger.error("Failed to add comment to Freshdesk ticket {}: {}", ticket_id, e)
             return False
     
     async def close(self) -> None:
-        """Close HTTP client."""
-        
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Nothing to close; the shared HTTP client is closed on shutdown."""
@@ -0,0 +1,127 @@
+"""
+Shared HTTP Client
+
+One connection pool for all helpdesk integrations, so client instances
+created per webhook or task reuse open TCP/TLS connections instead of
+each building and tearing down their own.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+import orjson
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    # HTTP/2 needs the optional h2 package (httpx[http2])
+    HTTP2_AVAILABLE = False
+
+HTTP_TIMEOUT = 30.0
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+# Attempts per request, and the longest wait between two of them
+RETRY_ATTEMPTS = 3
+RETRY_MAX_WAIT = 10.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client.
+
+    The client is created on first use. Pooled connections belong to the
+    event loop that opened them, so a new client is created when called
+    from a different loop (Celery tasks run each job in a fresh loop).
+
+    Returns:
+        httpx.AsyncClient: Shared async HTTP client
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        # No Accept-Encoding header: httpx advertises what it can decode,
+        # which includes br when the brotli extra is installed
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its connection pool."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> Optional[float]:
+    """
+    Get the wait before retrying, or None if the request should not be retried.
+
+    Transport errors, 429 and 5xx responses are retried with exponential
+    backoff; a 429's Retry-After is honoured, unless it asks for longer
+    than RETRY_MAX_WAIT. Other 4xx responses are final.
+    """
+    backoff = min(RETRY_MAX_WAIT, 2.0 ** attempt)
+    if response is None or response.status_code >= 500:
+        return backoff
+    if response.status_code != 429:
+        return None
+
+    try:
+        retry_after = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return backoff
+    return retry_after if retry_after <= RETRY_MAX_WAIT else None
+
+
+async def request_with_retry(method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a request over the shared client, retrying transient failures.
+
+    Args:
+        method: HTTP method
+        url: Absolute request URL
+        **kwargs: Passed to ``httpx.AsyncClient.request``; a ``json`` body
+            is encoded once with orjson rather than by httpx
+
+    Returns:
+        httpx.Response: The last response received
+    """
+    if "json" in kwargs:
+        kwargs["content"] = orjson.dumps(
+            kwargs.pop("json"), option=orjson.OPT_NON_STR_KEYS
+        )
+        kwargs["headers"] = {
+            **(kwargs.get("headers") or {}),
+            "Content-Type": "application/json",
+        }
+
+    client = get_http_client()
+    for attempt in range(RETRY_ATTEMPTS):
+        last = attempt == RETRY_ATTEMPTS - 1
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if last:
+                raise
+            response = None
+        else:
+            if last:
+                return response
+
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response
+        await asyncio.sleep(delay)
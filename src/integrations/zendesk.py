@@ -4,18 +4,25 @@ Zendesk Integration
 Client for Zendesk API v2.
 """
 
-from typing import Dict, List, Optional, Any
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Any
 from datetime import datetime
 
 import httpx
+import orjson
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config import settings
-from src.integrations.base import BaseIntegration, ExternalTicket
+from src.integrations.base import (
+    MAX_PAGE_CONCURRENCY,
+    CachingIntegration,
+    ExternalTicket,
+    iter_pages,
+)
+from src.integrations.http import request_with_retry
 
 
-class ZendeskClient(BaseIntegration):
+class ZendeskClient(CachingIntegration):
     """
     Zendesk API client.
     
@@ -26,6 +33,27 @@ class ZendeskClient(BaseIntegration):
     - Adding comments
     """
     
+    # Our status -> Zendesk status
+    STATUS_REVERSE_MAP = {
+        "new": "new",
+        "open": "open",
+        "in_progress": "pending",
+        "pending": "pending",
+        "resolved": "solved",
+        "closed": "closed"
+    }
+    
+    # Zendesk priority -> our 1-5 scale
+    PRIORITY_MAP = {
+        "urgent": 5,
+        "high": 4,
+        "normal": 3,
+        "low": 2
+    }
+    
+    # Our priority (clamped to 0-5) -> Zendesk priority
+    PRIORITY_REVERSE = ("low", "low", "low", "normal", "high", "urgent")
+    
     def __init__(
         self,
         subdomain: Optional[str] = None,
@@ -48,130 +76,160 @@ class ZendeskClient(BaseIntegration):
             logger.warning("Zendesk credentials not fully configured")
         
         self.base_url = f"https://{self.subdomain}.zendesk.com/api/v2"
-        self._client: Optional[httpx.AsyncClient] = None
+        self._auth = httpx.BasicAuth(f"{self.email}/token", self.api_token or "")
     
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                auth=(f"{self.email}/token", self.api_token),
-                headers={"Content-Type": "application/json"},
-                timeout=30.0
-            )
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send an authenticated request, retrying transient failures."""
         
-        return self._client
+        return await request_with_retry(
+            method,
+            f"{self.base_url}{path}",
+            auth=self._auth,
+            **kwargs
+        )
     
     async def authenticate(self) -> bool:
         """Test authentication with Zendesk."""
         
         try:
-            client = await self._get_client()
-            response = await client.get("/users/me.json")
+            response = await self._request("GET", "/users/me.json")
             response.raise_for_status()
             
-            user = response.json().get("user", {})
-            logger.info(f"Authenticated with Zendesk as {user.get('email')}")
+            user = orjson.loads(response.content).get("user", {})
+            logger.info("Authenticated with Zendesk as {}", user.get("email"))
             
             return True
             
         except Exception as e:
-            logger.error(f"Zendesk authentication failed: {e}")
+            logger.error("Zendesk authentication failed: {}", e)
             return False
     
     def _parse_ticket(self, data: Dict) -> ExternalTicket:
         """Parse Zendesk ticket data into ExternalTicket."""
         
+        requester = data.get("requester") or {}
         return ExternalTicket(
             id=str(data.get("id")),
             subject=data.get("subject"),
             content=data.get("description", ""),
             status=data.get("status", "new"),
             priority=self._map_priority_from_zendesk(data.get("priority")),
-            requester_email=data.get("requester", {}).get("email"),
-            requester_name=data.get("requester", {}).get("name"),
+            requester_email=requester.get("email"),
+            requester_name=requester.get("name"),
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
-            tags=data.get("tags", []),
+            tags=tuple(data.get("tags") or ()),
             custom_fields={
-                f.get("id"): f.get("value")
-                for f in data.get("custom_fields", [])
+                f["id"]: f["value"] for f in data.get("custom_fields") or ()
             }
         )
     
+    def _parse_many(self, rows: List[Dict]) -> List[ExternalTicket]:
+        """Parse a page of ticket data into ExternalTickets."""
+        
+        parse = self._parse_ticket
+        return [parse(row) for row in rows]
+    
+    @staticmethod
+    def _custom_fields_payload(custom_fields: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert a field ID -> value mapping to Zendesk's list format."""
+        return [{"id": k, "value": v} for k, v in custom_fields.items()]
+    
     def _map_priority_from_zendesk(self, priority: Optional[str]) -> int:
         """Map Zendesk priority to our 1-5 scale."""
-        mapping = {
-            "urgent": 5,
-            "high": 4,
-            "normal": 3,
-            "low": 2
-        }
-        return mapping.get(priority, 3)
+        return self.PRIORITY_MAP.get(priority, 3)
     
     def _map_priority_to_zendesk(self, priority: int) -> str:
         """Map our priority to Zendesk priority."""
-        if priority >= 5:
-            return "urgent"
-        elif priority >= 4:
-            return "high"
-        elif priority >= 3:
-            return "normal"
-        else:
-            return "low"
+        return self.PRIORITY_REVERSE[min(max(priority, 0), 5)]
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def get_ticket(self, ticket_id: str) -> Optional[ExternalTicket]:
         """Get a single ticket from Zendesk."""
         
         try:
-            client = await self._get_client()
-            response = await client.get(f"/tickets/{ticket_id}.json")
+            response = await self._request("GET", f"/tickets/{ticket_id}.json")
             
             if response.status_code == 404:
                 return None
             
             response.raise_for_status()
             
-            data = response.json().get("ticket", {})
+            data = orjson.loads(response.content).get("ticket", {})
             return self._parse_ticket(data)
             
         except Exception as e:
-            logger.error(f"Failed to get Zendesk ticket {ticket_id}: {e}")
+            logger.error("Failed to get Zendesk ticket {}: {}", ticket_id, e)
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
+    async def _fetch_ticket_page(
+        self,
+        status: Optional[str],
+        page: int,
+        per_page: int
+    ) -> List[ExternalTicket]:
+        """Fetch one page of tickets."""
+        
+        # Build query
+        params = {"page": page, "per_page": per_page}
+        
+        if status:
+            params["query"] = f"status:{status}"
+        
+        response = await self._request("GET", "/tickets.json", params=params)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        return self._parse_many(data.get("tickets", []))
+    
     async def get_tickets(
         self,
         status: Optional[str] = None,
         since: Optional[str] = None,
         limit: int = 100
     ) -> List[ExternalTicket]:
-        """Get tickets from Zendesk."""
+        """Get tickets from Zendesk, fetching the pages needed concurrently."""
+        
+        if limit < 1:
+            return []
         
+        per_page = min(limit, 100)
+        pages = -(-limit // per_page)
+        
+        tickets: List[ExternalTicket] = []
         try:
-            client = await self._get_client()
-            
-            # Build query
-            params = {"per_page": min(limit, 100)}
-            
-            if status:
-                params["query"] = f"status:{status}"
-            
-            response = await client.get("/tickets.json", params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            tickets = [self._parse_ticket(t) for t in data.get("tickets", [])]
-            
-            return tickets
-            
+            async with aclosing(self.stream_tickets(
+                status,
+                since,
+                batch_size=per_page,
+                concurrency=min(pages, MAX_PAGE_CONCURRENCY)
+            )) as stream:
+                async for ticket in stream:
+                    tickets.append(ticket)
+                    if len(tickets) >= limit:
+                        break
         except Exception as e:
-            logger.error(f"Failed to get Zendesk tickets: {e}")
+            logger.error("Failed to get Zendesk tickets: {}", e)
             raise
+        
+        return tickets
+    
+    async def stream_tickets(
+        self,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        batch_size: int = 100,
+        concurrency: int = 4
+    ) -> AsyncIterator[ExternalTicket]:
+        """Iterate over all Zendesk tickets, fetching pages concurrently."""
+        
+        per_page = min(batch_size, 100)
+        async for ticket in iter_pages(
+            lambda page: self._fetch_ticket_page(status, page, per_page),
+            page_size=per_page,
+            concurrency=concurrency
+        ):
+            yield ticket
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def create_ticket(
         self,
         subject: str,
@@ -184,8 +242,6 @@ class ZendeskClient(BaseIntegration):
         """Create a new ticket in Zendesk."""
         
         try:
-            client = await self._get_client()
-            
             ticket_data = {
                 "ticket": {
                     "subject": subject,
@@ -199,26 +255,24 @@ class ZendeskClient(BaseIntegration):
                 ticket_data["ticket"]["priority"] = self._map_priority_to_zendesk(priority)
             
             if custom_fields:
-                ticket_data["ticket"]["custom_fields"] = [
-                    {"id": k, "value": v}
-                    for k, v in custom_fields.items()
-                ]
+                ticket_data["ticket"]["custom_fields"] = self._custom_fields_payload(
+                    custom_fields
+                )
             
-            response = await client.post("/tickets.json", json=ticket_data)
+            response = await self._request("POST", "/tickets.json", json=ticket_data)
             response.raise_for_status()
             
-            created = response.json().get("ticket", {})
+            created = orjson.loads(response.content).get("ticket", {})
             ticket_id = str(created.get("id"))
             
-            logger.info(f"Created Zendesk ticket: {ticket_id}")
+            logger.info("Created Zendesk ticket: {}", ticket_id)
             
             return ticket_id
             
         except Exception as e:
-            logger.error(f"Failed to create Zendesk ticket: {e}")
+            logger.error("Failed to create Zendesk ticket: {}", e)
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def update_ticket(
         self,
         ticket_id: str,
@@ -233,21 +287,10 @@ class ZendeskClient(BaseIntegration):
         """Update a ticket in Zendesk."""
         
         try:
-            client = await self._get_client()
-            
             ticket_data: Dict[str, Any] = {}
             
             if status:
-                # Map our status to Zendesk status
-                status_map = {
-                    "new": "new",
-                    "open": "open",
-                    "in_progress": "pending",
-                    "pending": "pending",
-                    "resolved": "solved",
-                    "closed": "closed"
-                }
-                ticket_data["status"] = status_map.get(status, status)
+                ticket_data["status"] = self.STATUS_REVERSE_MAP.get(status, status)
             
             if priority:
                 ticket_data["priority"] = self._map_priority_to_zendesk(priority)
@@ -265,29 +308,27 @@ class ZendeskClient(BaseIntegration):
                 ticket_data["tags"].append(f"category:{category}")
             
             if custom_fields:
-                ticket_data["custom_fields"] = [
-                    {"id": k, "value": v}
-                    for k, v in custom_fields.items()
-                ]
+                ticket_data["custom_fields"] = self._custom_fields_payload(custom_fields)
             
             if not ticket_data:
                 return True
             
-            response = await client.put(
+            response = await self._request(
+                "PUT",
                 f"/tickets/{ticket_id}.json",
                 json={"ticket": ticket_data}
             )
             response.raise_for_status()
             
-            logger.info(f"Updated Zendesk ticket: {ticket_id}")
+            logger.info("Updated Zendesk ticket: {}", ticket_id)
+            await self.invalidate_ticket(ticket_id)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to update Zendesk ticket {ticket_id}: {e}")
+            logger.error("Failed to update Zendesk ticket {}: {}", ticket_id, e)
             return False
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def add_comment(
         self,
         ticket_id: str,
@@ -298,8 +339,6 @@ class ZendeskClient(BaseIntegration):
         """Add a comment to a Zendesk ticket."""
         
         try:
-            client = await self._get_client()
-            
             comment_data = {
                 "ticket": {
                     "comment": {
@@ -312,23 +351,58 @@ class ZendeskClient(BaseIntegration):
             if author_id:
                 comment_data["ticket"]["comment"]["author_id"] = author_id
             
-            response = await client.put(
+            response = await self._request(
+                "PUT",
                 f"/tickets/{ticket_id}.json",
                 json=comment_data
             )
             response.raise_for_status()
             
-            logger.info(f"Added comment to Zendesk ticket: {ticket_id}")
+            logger.info("Added comment to Zendesk ticket: {}", ticket_id)
+            await self.invalidate_ticket(ticket_id)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to add comment to Zendesk ticket {ticket_id}: {e}")
+            logger.error("Failed to add comment to Zendesk ticket {}: {}", ticket_id, e)
             return False
     
-    async def close(self) -> None:
-        """Close HTTP client."""
+    async def reply_and_resolve(
+        self,
+        ticket_id: str,
+        content: str,
+        public: bool = True,
+        author_id: Optional[str] = None
+    ) -> bool:
+        """Add a comment and resolve a Zendesk ticket in a single update."""
         
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # Comments are ticket updates in Zendesk, so one PUT carries both
+        # instead of two concurrent writes to the same ticket
+        try:
+            comment: Dict[str, Any] = {"body": content, "public": public}
+            if author_id:
+                comment["author_id"] = author_id
+            
+            response = await self._request(
+                "PUT",
+                f"/tickets/{ticket_id}.json",
+                json={
+                    "ticket": {
+                        "comment": comment,
+                        "status": self.STATUS_REVERSE_MAP["resolved"]
+                    }
+                }
+            )
+            response.raise_for_status()
+            
+            logger.info("Replied to and resolved Zendesk ticket: {}", ticket_id)
+            await self.invalidate_ticket(ticket_id)
+            
+            return True
+            
+        except Exception as e:
+            logger.error("Failed to reply to and resolve Zendesk ticket {}: {}", ticket_id, e)
+            return False
+    
+    async def close(self) -> None:
+        """Nothing to close; the shared HTTP client is closed on shutdown."""
@@ -4,16 +4,20 @@ FastAPI Application Entry Point
 This is the main entry point for the Intelligent Support Router API.
 """
 
+import asyncio
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
+from src.cache import close_redis
 from src.config import settings
 from src.database import close_db, init_db
+from src.integrations.http import close_http_client
 
 # Import routers
 from src.api.tickets import router as tickets_router
@@ -40,18 +44,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info(f"Environment: {settings.app_env}")
     logger.info(f"Debug mode: {settings.debug}")
     
-    # Initialize database
+    # Initialize the database and the vector database (ChromaDB) concurrently
+    from src.services.rag import knowledge_base
+    kb_task = asyncio.create_task(knowledge_base.initialize())
+    
     try:
         await init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
+        kb_task.cancel()
         raise
     
-    # Initialize vector database (ChromaDB)
     try:
-        from src.services.rag import knowledge_base
-        await knowledge_base.initialize()
+        await kb_task
         logger.info("Knowledge base initialized successfully")
     except Exception as e:
         logger.warning(f"Failed to initialize knowledge base: {e}")
@@ -63,9 +69,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Shutdown
     logger.info("Shutting down application...")
     await close_db()
+    await close_redis()
+    await close_http_client()
     logger.info("Application shutdown complete")
 
 
+# -----------------------------------------------------------------------------
+# Logging
+# -----------------------------------------------------------------------------
+
+def configure_logging() -> None:
+    """
+    Send logs to stderr at the configured level.
+    
+    Outside debug mode, tracebacks skip loguru's extended backtrace and
+    variable inspection, which walk every frame of the stack.
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=settings.log_level,
+        backtrace=settings.debug,
+        diagnose=settings.debug,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Application Factory
 # -----------------------------------------------------------------------------
@@ -77,6 +105,8 @@ def create_application() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application
     """
+    configure_logging()
+    
     app = FastAPI(
         title=settings.app_name,
         description="""
@@ -104,6 +134,7 @@ def create_application() -> FastAPI:
         redoc_url="/redoc",
         openapi_url=f"{settings.api_v1_prefix}/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Add CORS middleware
@@ -149,10 +180,13 @@ def create_application() -> FastAPI:
     
     # Global exception handler
     @app.exception_handler(Exception)
-    async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
         """Handle all unhandled exceptions."""
-        logger.error(f"Unhandled exception: {exc}", exc_info=True)
-        return JSONResponse(
+        # The traceback is only formatted if a sink writes the record
+        logger.opt(exception=exc).error(
+            "Unhandled exception on {} {}", request.method, request.url.path
+        )
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "detail": "Internal server error",
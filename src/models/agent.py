@@ -10,10 +10,10 @@ from enum import Enum
 
 from sqlalchemy import (
     Column, String, Integer, Float, DateTime,
-    Boolean, JSON, Enum as SQLEnum
+    Boolean, JSON, Enum as SQLEnum, Index, text
 )
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 
 from src.database import Base
@@ -74,6 +74,43 @@ class Agent(Base):
     
     __tablename__ = "agents"
     
+    # Trigram indexes for substring search on name/email (requires pg_trgm,
+    # created in scripts/init-db.sql), and jsonb_path_ops GIN indexes for
+    # the ``@>`` skill/language filters. Other dialects get a plain index.
+    __table_args__ = (
+        Index(
+            "agents_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "agents_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "agents_skills_gin",
+            "skills",
+            postgresql_using="gin",
+            postgresql_ops={"skills": "jsonb_path_ops"},
+        ),
+        Index(
+            "agents_languages_gin",
+            "languages",
+            postgresql_using="gin",
+            postgresql_ops={"languages": "jsonb_path_ops"},
+        ),
+        # Routing only looks at online, active agents; SQLEnum stores the
+        # member name, hence 'ONLINE'
+        Index(
+            "ix_agents_available",
+            "current_load",
+            postgresql_where=text("status = 'ONLINE' AND is_active = true"),
+        ),
+    )
+    
     # Primary key
     id = Column(
         UUID(as_uuid=True),
@@ -101,13 +138,24 @@ class Agent(Base):
     team = Column(String(100), nullable=True, index=True)
     department = Column(String(100), nullable=True)
     
-    # Skills and capabilities (stored as JSON array for SQLite compatibility)
-    skills = Column(JSON, default=list, nullable=False)
-    languages = Column(JSON, default=lambda: ["en"], nullable=False)
+    # Skills and capabilities (JSON array; JSONB on PostgreSQL so it can be
+    # GIN-indexed, plain JSON for SQLite compatibility)
+    skills = Column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        default=list,
+        nullable=False
+    )
+    languages = Column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        default=lambda: ["en"],
+        nullable=False
+    )
     experience_level = Column(Integer, default=1)  # 1-5, junior to senior
     
     # Specializations (category expertise)
-    specializations = Column(JSON, default=dict)  # {"technical_issue": 0.9, "billing": 0.7}
+    specializations = Column(
+        JSON().with_variant(JSONB(), "postgresql"), default=dict
+    )  # {"technical_issue": 0.9, "billing": 0.7}
     
     # Workload
     current_load = Column(Integer, default=0)
@@ -168,8 +216,9 @@ class Agent(Base):
         nullable=False
     )
     
-    # Relationships
-    tickets = relationship("Ticket", back_populates="assigned_agent")
+    # Relationships (never loaded implicitly; an agent can have thousands
+    # of tickets, so callers query them or opt in with selectinload)
+    tickets = relationship("Ticket", back_populates="assigned_agent", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Agent(id={self.id}, name={self.name}, status={self.status})>"
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import Column, String, Integer, Float, Text, DateTime, Boolean, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 
 from src.database import Base
@@ -72,10 +72,16 @@ class Category(Base):
     sla_first_response_hours = Column(Float, default=4.0)
     sla_resolution_hours = Column(Float, default=24.0)
     
-    # AI configuration
-    keywords = Column(JSON, default=list)  # Keywords indicating this category
-    keywords_tr = Column(JSON, default=list)  # Turkish keywords
-    negative_keywords = Column(JSON, default=list)  # Keywords excluding this category
+    # AI configuration (JSONB on PostgreSQL, plain JSON for SQLite compatibility)
+    keywords = Column(
+        JSON().with_variant(JSONB(), "postgresql"), default=list
+    )  # Keywords indicating this category
+    keywords_tr = Column(
+        JSON().with_variant(JSONB(), "postgresql"), default=list
+    )  # Turkish keywords
+    negative_keywords = Column(
+        JSON().with_variant(JSONB(), "postgresql"), default=list
+    )  # Keywords excluding this category
     
     # Few-shot examples for AI
     examples = Column(JSON, default=list)  # [{"text": "...", "explanation": "..."}]
@@ -251,3 +257,6 @@ DEFAULT_CATEGORIES = [
         "sla_resolution_hours": 8.0,
     },
 ]
+
+# Names of the default categories, precomputed for seeding lookups
+DEFAULT_CATEGORY_NAMES = tuple(c["name"] for c in DEFAULT_CATEGORIES)
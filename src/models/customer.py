@@ -28,6 +28,25 @@ class CustomerTier(str, Enum):
     ENTERPRISE = "enterprise"
 
 
+# Priority adjustment per tier
+TIER_PRIORITY_BOOSTS = {
+    CustomerTier.FREE: -1,
+    CustomerTier.STANDARD: 0,
+    CustomerTier.PREMIUM: 1,
+    CustomerTier.VIP: 2,
+    CustomerTier.ENTERPRISE: 2,
+}
+
+# SLA time multiplier per tier (lower = faster response)
+TIER_SLA_MULTIPLIERS = {
+    CustomerTier.FREE: 2.0,
+    CustomerTier.STANDARD: 1.0,
+    CustomerTier.PREMIUM: 0.75,
+    CustomerTier.VIP: 0.5,
+    CustomerTier.ENTERPRISE: 0.25,
+}
+
+
 class Customer(Base):
     """
     Customer model representing a support ticket submitter.
@@ -143,8 +162,9 @@ class Customer(Base):
         nullable=False
     )
     
-    # Relationships
-    tickets = relationship("Ticket", back_populates="customer")
+    # Relationships (never loaded implicitly; a customer can have thousands
+    # of tickets, so callers query them or opt in with selectinload)
+    tickets = relationship("Ticket", back_populates="customer", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Customer(id={self.id}, email={self.email}, tier={self.tier})>"
@@ -169,22 +189,8 @@ class Customer(Base):
     @property
     def priority_boost(self) -> int:
         """Get priority boost based on tier."""
-        boosts = {
-            CustomerTier.FREE: -1,
-            CustomerTier.STANDARD: 0,
-            CustomerTier.PREMIUM: 1,
-            CustomerTier.VIP: 2,
-            CustomerTier.ENTERPRISE: 2,
-        }
-        return boosts.get(self.tier, 0)
+        return TIER_PRIORITY_BOOSTS.get(self.tier, 0)
     
     def get_sla_multiplier(self) -> float:
         """Get SLA time multiplier based on tier (lower = faster response)."""
-        multipliers = {
-            CustomerTier.FREE: 2.0,
-            CustomerTier.STANDARD: 1.0,
-            CustomerTier.PREMIUM: 0.75,
-            CustomerTier.VIP: 0.5,
-            CustomerTier.ENTERPRISE: 0.25,
-        }
-        return multipliers.get(self.tier, 1.0)
+        return TIER_SLA_MULTIPLIERS.get(self.tier, 1.0)
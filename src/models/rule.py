@@ -10,7 +10,7 @@ from enum import Enum
 
 from sqlalchemy import (
     Column, String, Integer, Float, Text, DateTime,
-    Boolean, JSON, Enum as SQLEnum
+    Boolean, JSON, Enum as SQLEnum, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -70,6 +70,17 @@ class RoutingRule(Base):
     
     __tablename__ = "routing_rules"
     
+    # Matches the rule listing/evaluation shape: filter on is_active (and
+    # optionally rule_type), ordered by priority descending
+    __table_args__ = (
+        Index(
+            "ix_routing_rules_active_priority",
+            "is_active",
+            text("priority DESC"),
+            "rule_type",
+        ),
+    )
+    
     # Primary key
     id = Column(
         UUID(as_uuid=True),
@@ -79,7 +90,7 @@ class RoutingRule(Base):
     )
     
     # Basic info
-    name = Column(String(200), nullable=False)
+    name = Column(String(200), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     
     # Rule type and conditions
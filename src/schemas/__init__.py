@@ -22,6 +22,10 @@ from src.schemas.category import (
     CategoryUpdate,
     CategoryResponse,
 )
+from src.schemas.rule import (
+    RoutingRuleCreate,
+    RoutingRuleUpdate,
+)
 from src.schemas.customer import (
     CustomerCreate,
     CustomerUpdate,
@@ -50,6 +54,9 @@ __all__ = [
     "CategoryCreate",
     "CategoryUpdate",
     "CategoryResponse",
+    # Routing Rule
+    "RoutingRuleCreate",
+    "RoutingRuleUpdate",
     # Customer
     "CustomerCreate",
     "CustomerUpdate",
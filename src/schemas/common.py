@@ -5,7 +5,7 @@ Shared schemas used across the application.
 """
 
 from datetime import datetime
-from typing import Generic, TypeVar, Optional, List, Any
+from typing import Generic, TypeVar, Optional, List, Any, Dict
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -42,6 +42,10 @@ class PaginatedResponse(BaseModel, Generic[T]):
     pages: int = Field(description="Total number of pages")
     has_next: bool = Field(description="Whether there is a next page")
     has_prev: bool = Field(description="Whether there is a previous page")
+    next_cursor: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="Query parameters to request the next page by keyset"
+    )
     
     model_config = ConfigDict(from_attributes=True)
     
@@ -51,7 +55,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
         items: List[T],
         total: int,
         page: int,
-        page_size: int
+        page_size: int,
+        next_cursor: Optional[Dict[str, str]] = None
     ) -> "PaginatedResponse[T]":
         """Create a paginated response."""
         pages = (total + page_size - 1) // page_size if page_size > 0 else 0
@@ -62,7 +67,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
             page_size=page_size,
             pages=pages,
             has_next=page < pages,
-            has_prev=page > 1
+            has_prev=page > 1,
+            next_cursor=next_cursor
         )
 
 
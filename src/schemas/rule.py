@@ -0,0 +1,84 @@
+"""
+Routing Rule Pydantic Schemas
+
+Request schemas for routing rule operations.
+"""
+
+from typing import Optional, List, Dict, Any
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from src.models.rule import RuleAction, RuleType
+
+
+# -----------------------------------------------------------------------------
+# Routing Rule Create
+# -----------------------------------------------------------------------------
+
+class RoutingRuleCreate(BaseModel):
+    """Schema for creating a new routing rule."""
+    
+    name: str = Field(min_length=1, max_length=200)
+    description: Optional[str] = Field(default=None)
+    
+    # Conditions
+    rule_type: RuleType
+    conditions: Dict[str, Any]
+    
+    # Action
+    action: RuleAction
+    action_params: Dict[str, Any] = Field(default_factory=dict)
+    
+    # Control
+    priority: int = Field(default=0)
+    is_active: bool = Field(default=True)
+    is_exclusive: bool = Field(default=True)
+    
+    # Scope
+    applies_to_sources: Optional[List[str]] = Field(default=None)
+    applies_to_categories: Optional[List[str]] = Field(default=None)
+    
+    created_by: Optional[str] = Field(default=None, max_length=255)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "name": "VIP Escalation",
+                "description": "Escalate tickets from VIP customers",
+                "rule_type": "customer",
+                "conditions": {"tiers": ["vip"]},
+                "action": "escalate",
+                "action_params": {"reason": "VIP customer"},
+                "priority": 100
+            }
+        }
+    )
+
+
+# -----------------------------------------------------------------------------
+# Routing Rule Update
+# -----------------------------------------------------------------------------
+
+class RoutingRuleUpdate(BaseModel):
+    """Schema for updating a routing rule."""
+    
+    name: Optional[str] = Field(default=None, min_length=1, max_length=200)
+    description: Optional[str] = Field(default=None)
+    
+    rule_type: Optional[RuleType] = Field(default=None)
+    conditions: Optional[Dict[str, Any]] = Field(default=None)
+    
+    action: Optional[RuleAction] = Field(default=None)
+    action_params: Optional[Dict[str, Any]] = Field(default=None)
+    
+    priority: Optional[int] = Field(default=None)
+    is_active: Optional[bool] = Field(default=None)
+    is_exclusive: Optional[bool] = Field(default=None)
+    
+    @field_validator("name", "rule_type", "conditions", "action", "action_params")
+    @classmethod
+    def _not_null(cls, value: Any) -> Any:
+        """Reject an explicit null for columns that cannot be cleared."""
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
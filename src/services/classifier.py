@@ -6,7 +6,7 @@ Turkish language support and confidence scoring.
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
 from openai import AsyncOpenAI
@@ -22,6 +22,53 @@ import redis.asyncio as redis
 from src.config import settings
 
 
+# Keyword mappings for the rule-based fallback
+FALLBACK_KEYWORDS: Dict[str, List[str]] = {
+    "technical_issue": [
+        "error", "failure", "not working", "broken", "crash",
+        "bug", "issue", "problem", "glitch", "defective"
+    ],
+    "billing_question": [
+        "invoice", "payment", "charge", "price", "cost", 
+        "bill", "receipt", "subscription", "fee", "refund"
+    ],
+    "feature_request": [
+        "feature", "suggestion", "add", "request", "improve",
+        "enhancement", "idea", "would be nice"
+    ],
+    "bug_report": [
+        "bug", "defect", "flaw", "wrong", "unexpected",
+        "error", "glitch", "malfunction"
+    ],
+    "account_management": [
+        "account", "password", "login", "profile", "access",
+        "register", "signup", "signin", "auth"
+    ],
+    "return_refund": [
+        "return", "refund", "exchange", "cancel", "money back",
+        "reimbursement"
+    ],
+    "complaint": [
+        "complaint", "unhappy", "terrible", "bad", "worst",
+        "disappointed", "awful", "horrible", "upset", "angry"
+    ]
+}
+
+
+def _build_keyword_index() -> Dict[str, Tuple[str, ...]]:
+    """Map each fallback keyword to the categories it scores for."""
+    index: Dict[str, Tuple[str, ...]] = {}
+    for category, keywords in FALLBACK_KEYWORDS.items():
+        for keyword in keywords:
+            index[keyword] = index.get(keyword, ()) + (category,)
+    return index
+
+
+# Keywords shared between categories ("bug", "error", "refund")
+# are searched for once per ticket rather than once per category
+_FALLBACK_KEYWORD_INDEX = _build_keyword_index()
+
+
 class ClassificationError(Exception):
     """Exception raised when classification fails."""
     pass
@@ -297,42 +344,16 @@ Think step by step and respond in JSON format:
         """
         text_lower = text.lower()
         
-        # Keyword mappings
-        keyword_map = {
-            "technical_issue": [
-                "error", "failure", "not working", "broken", "crash",
-                "bug", "issue", "problem", "glitch", "defective"
-            ],
-            "billing_question": [
-                "invoice", "payment", "charge", "price", "cost", 
-                "bill", "receipt", "subscription", "fee", "refund"
-            ],
-            "feature_request": [
-                "feature", "suggestion", "add", "request", "improve",
-                "enhancement", "idea", "would be nice"
-            ],
-            "bug_report": [
-                "bug", "defect", "flaw", "wrong", "unexpected",
-                "error", "glitch", "malfunction"
-            ],
-            "account_management": [
-                "account", "password", "login", "profile", "access",
-                "register", "signup", "signin", "auth"
-            ],
-            "return_refund": [
-                "return", "refund", "exchange", "cancel", "money back",
-                "reimbursement"
-            ],
-            "complaint": [
-                "complaint", "unhappy", "terrible", "bad", "worst",
-                "disappointed", "awful", "horrible", "upset", "angry"
-            ]
-        }
+        hits = dict.fromkeys(FALLBACK_KEYWORDS, 0)
+        for keyword, categories in _FALLBACK_KEYWORD_INDEX.items():
+            if keyword in text_lower:
+                for category in categories:
+                    hits[category] += 1
         
-        scores = {}
-        for category, keywords in keyword_map.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
-            scores[category] = min(score * 0.2, 0.9)  # Cap at 0.9
+        scores = {
+            category: min(score * 0.2, 0.9)  # Cap at 0.9
+            for category, score in hits.items()
+        }
         
         # Default to general_inquiry
         scores["general_inquiry"] = 0.3
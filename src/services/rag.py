@@ -5,9 +5,10 @@ Knowledge base management and suggested response generation
 using vector similarity search.
 """
 
+import asyncio
 import json
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -16,6 +17,9 @@ from loguru import logger
 
 from src.config import settings
 
+# (faq_id, question, answer, category, tags) as accepted by add_faqs
+FAQRow = Tuple[str, str, str, Optional[str], Sequence[str]]
+
 
 class KnowledgeBase:
     """
@@ -58,24 +62,9 @@ class KnowledgeBase:
             return
         
         try:
-            import chromadb
-            from chromadb.config import Settings as ChromaSettings
-            
-            # Create persist directory if needed
-            os.makedirs(self.persist_directory, exist_ok=True)
-            
-            # Initialize ChromaDB client
-            self._chroma_client = chromadb.Client(ChromaSettings(
-                chroma_db_impl="duckdb+parquet",
-                persist_directory=self.persist_directory,
-                anonymized_telemetry=False
-            ))
-            
-            # Get or create collection
-            self._collection = self._chroma_client.get_or_create_collection(
-                name=self.collection_name,
-                metadata={"description": "Support ticket knowledge base"}
-            )
+            # Loading chromadb and opening the store block, so keep them
+            # off the event loop (startup runs this next to init_db)
+            self._collection = await asyncio.to_thread(self._open_collection)
             
             self._initialized = True
             logger.info(f"ChromaDB collection '{self.collection_name}' ready")
@@ -89,6 +78,28 @@ class KnowledgeBase:
             self._collection = InMemoryCollection()
             self._initialized = True
     
+    def _open_collection(self):
+        """Create the ChromaDB client and get or create the collection."""
+        
+        import chromadb
+        from chromadb.config import Settings as ChromaSettings
+        
+        # Create persist directory if needed
+        os.makedirs(self.persist_directory, exist_ok=True)
+        
+        # Initialize ChromaDB client
+        self._chroma_client = chromadb.Client(ChromaSettings(
+            chroma_db_impl="duckdb+parquet",
+            persist_directory=self.persist_directory,
+            anonymized_telemetry=False
+        ))
+        
+        # Get or create collection
+        return self._chroma_client.get_or_create_collection(
+            name=self.collection_name,
+            metadata={"description": "Support ticket knowledge base"}
+        )
+    
     async def _get_embedding(self, text: str) -> List[float]:
         """Get embedding vector for text using OpenAI."""
         
@@ -103,6 +114,20 @@ class KnowledgeBase:
             # Return zero vector as fallback
             return [0.0] * 1536
     
+    async def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embedding vectors for several texts in one OpenAI request."""
+        
+        try:
+            response = await self.client.embeddings.create(
+                model=settings.openai_embedding_model,
+                input=[text[:8000] for text in texts]  # Limit length
+            )
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            logger.error(f"Batch embedding generation failed: {e}")
+            # Return zero vectors as fallback
+            return [[0.0] * 1536 for _ in texts]
+    
     async def add_document(
         self,
         doc_id: str,
@@ -142,6 +167,46 @@ class KnowledgeBase:
             logger.error(f"Failed to add document: {e}")
             return False
     
+    async def add_documents(
+        self,
+        doc_ids: List[str],
+        contents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Add several documents with one embedding request and one write.
+        
+        Args:
+            doc_ids: Unique document identifiers
+            contents: Document contents, aligned with doc_ids
+            metadatas: Metadata per document, aligned with doc_ids
+            
+        Returns:
+            bool: Success status
+        """
+        
+        if not doc_ids:
+            return True
+        
+        await self.initialize()
+        
+        try:
+            embeddings = await self._get_embeddings(contents)
+            
+            self._collection.add(
+                ids=doc_ids,
+                embeddings=embeddings,
+                documents=contents,
+                metadatas=metadatas
+            )
+            
+            logger.info(f"Added {len(doc_ids)} documents to knowledge base")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to add documents: {e}")
+            return False
+    
     async def add_resolved_ticket(
         self,
         ticket_id: str,
@@ -211,28 +276,64 @@ class KnowledgeBase:
             bool: Success status
         """
         
+        doc_id, content, metadata = self._faq_document(
+            faq_id, question, answer, category, tags
+        )
+        
+        return await self.add_document(
+            doc_id=doc_id,
+            content=content,
+            metadata=metadata
+        )
+    
+    async def add_faqs(self, faqs: Sequence[FAQRow]) -> bool:
+        """
+        Add several FAQ entries in a single batch.
+        
+        Args:
+            faqs: (faq_id, question, answer, category, tags) rows
+            
+        Returns:
+            bool: Success status
+        """
+        
+        documents = [self._faq_document(*faq) for faq in faqs]
+        
+        return await self.add_documents(
+            doc_ids=[doc[0] for doc in documents],
+            contents=[doc[1] for doc in documents],
+            metadatas=[doc[2] for doc in documents]
+        )
+    
+    @staticmethod
+    def _faq_document(
+        faq_id: str,
+        question: str,
+        answer: str,
+        category: Optional[str],
+        tags: Optional[Sequence[str]]
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Build the (doc_id, content, metadata) stored for an FAQ."""
+        
         content = f"FAQ: {question}\n\nAnswer: {answer}"
         
         metadata = {
             "type": "faq",
             "question": question,
             "category": category,
-            "tags": tags or [],
+            "tags": list(tags) if tags else [],
             "added_at": datetime.utcnow().isoformat()
         }
         
-        return await self.add_document(
-            doc_id=f"faq_{faq_id}",
-            content=content,
-            metadata=metadata
-        )
+        return f"faq_{faq_id}", content, metadata
     
     async def find_similar(
         self,
         query: str,
         category: Optional[str] = None,
         limit: int = 5,
-        min_score: float = 0.5
+        min_score: float = 0.5,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Find similar documents in knowledge base.
@@ -242,6 +343,7 @@ class KnowledgeBase:
             category: Filter by category
             limit: Maximum results
             min_score: Minimum similarity score (0-1)
+            query_embedding: Precomputed embedding of ``query``, if available
             
         Returns:
             List of similar documents with scores
@@ -251,7 +353,8 @@ class KnowledgeBase:
         
         try:
             # Generate query embedding
-            query_embedding = await self._get_embedding(query)
+            if query_embedding is None:
+                query_embedding = await self._get_embedding(query)
             
             # Build where filter
             where_filter = None
@@ -296,7 +399,8 @@ class KnowledgeBase:
         ticket_content: str,
         category: Optional[str] = None,
         language: str = "tr",
-        limit: int = 3
+        limit: int = 3,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate suggested responses for a ticket.
@@ -308,6 +412,7 @@ class KnowledgeBase:
             category: Ticket category
             language: Response language
             limit: Number of suggestions
+            query_embedding: Precomputed embedding of the ticket content
             
         Returns:
             List of suggested responses
@@ -320,7 +425,8 @@ class KnowledgeBase:
         similar_docs = await self.find_similar(
             query=ticket_content,
             category=category,
-            limit=5
+            limit=5,
+            query_embedding=query_embedding
         )
         
         # Extract responses from similar documents
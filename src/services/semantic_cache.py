@@ -0,0 +1,173 @@
+"""
+Semantic Cache Service
+
+Reuses suggested responses across near-duplicate tickets
+(password resets, refund requests, ...) using random-projection
+locality-sensitive hashing over the ticket embedding.
+"""
+
+import math
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import uuid4
+
+import orjson
+from loguru import logger
+
+from src.cache import get_redis
+from src.services.rag import knowledge_base
+
+# Number of independent hash tables; more tables raise recall
+SIGNATURE_TABLES = 4
+
+# Hyperplanes per table; more bits make each bucket more selective
+SIGNATURE_BITS = 12
+
+# Minimum cosine similarity for a cached entry to count as a hit
+SIMILARITY_THRESHOLD = 0.95
+
+# Cached suggestions go stale as the knowledge base changes
+SEMANTIC_CACHE_TTL = 6 * 60 * 60
+
+# Fixed seed so every worker projects onto the same hyperplanes
+PROJECTION_SEED = 1337
+
+_projections: Dict[int, List[List[List[float]]]] = {}
+
+ComputeFn = Callable[[List[float]], Awaitable[List[Dict[str, Any]]]]
+
+
+def _get_projections(dim: int) -> List[List[List[float]]]:
+    """Get the random hyperplanes for embeddings of size ``dim``."""
+    if dim not in _projections:
+        rng = random.Random(PROJECTION_SEED)
+        _projections[dim] = [
+            [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(SIGNATURE_BITS)]
+            for _ in range(SIGNATURE_TABLES)
+        ]
+    return _projections[dim]
+
+
+def _signatures(vector: List[float]) -> List[str]:
+    """Compute one ``sign(W @ e)`` bit signature per hash table."""
+    signatures = []
+    for table, planes in enumerate(_get_projections(len(vector))):
+        bits = 0
+        for plane in planes:
+            bits = (bits << 1) | (sum(w * x for w, x in zip(plane, vector)) >= 0)
+        signatures.append(f"{table}:{bits:x}")
+    return signatures
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    """Cosine similarity between two vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _bucket_key(category: Optional[str], language: str) -> str:
+    return f"semantic_cache:{category or 'none'}:{language}"
+
+
+def _entry_key(entry_id: str) -> str:
+    return f"semantic_cache:entry:{entry_id}"
+
+
+async def _lookup(
+    bucket_key: str,
+    signatures: List[str],
+    vector: List[float]
+) -> Optional[List[Dict[str, Any]]]:
+    """Find cached responses for the closest verified neighbour, if any."""
+    redis = get_redis()
+
+    entry_ids = {e for e in await redis.hmget(bucket_key, signatures) if e}
+    if not entry_ids:
+        return None
+
+    best_score, best_responses = 0.0, None
+    for raw in await redis.mget([_entry_key(e.decode()) for e in entry_ids]):
+        if raw is None:
+            continue
+        entry = orjson.loads(raw)
+        score = _cosine(vector, entry["vector"])
+        if score >= SIMILARITY_THRESHOLD and score > best_score:
+            best_score, best_responses = score, entry["responses"]
+
+    return best_responses
+
+
+async def _store(
+    bucket_key: str,
+    signatures: List[str],
+    vector: List[float],
+    responses: List[Dict[str, Any]]
+) -> None:
+    """Store responses under every signature of ``vector``."""
+    entry_id = uuid4().hex
+
+    async with get_redis().pipeline(transaction=False) as pipe:
+        pipe.setex(
+            _entry_key(entry_id),
+            SEMANTIC_CACHE_TTL,
+            orjson.dumps({"vector": vector, "responses": responses})
+        )
+        pipe.hset(bucket_key, mapping={sig: entry_id for sig in signatures})
+        pipe.expire(bucket_key, SEMANTIC_CACHE_TTL)
+        await pipe.execute()
+
+
+async def get_or_compute(
+    text: str,
+    category: Optional[str],
+    language: str,
+    compute_fn: ComputeFn
+) -> List[Dict[str, Any]]:
+    """
+    Get suggested responses for a near-duplicate ticket, or compute them.
+
+    The text is embedded once with the knowledge base encoder. Candidates
+    come from the matching LSH buckets and are only reused when their
+    cosine similarity reaches SIMILARITY_THRESHOLD. The cache fails open:
+    Redis errors fall through to ``compute_fn``.
+
+    Args:
+        text: Ticket content
+        category: Ticket category
+        language: Response language
+        compute_fn: Coroutine function computing responses from the embedding
+
+    Returns:
+        List of suggested responses
+    """
+
+    vector = await knowledge_base._get_embedding(text)
+
+    # A zero vector means embedding failed; don't cache against it
+    if not any(vector):
+        return await compute_fn(vector)
+
+    bucket_key = _bucket_key(category, language)
+    signatures = _signatures(vector)
+
+    try:
+        cached = await _lookup(bucket_key, signatures, vector)
+        if cached is not None:
+            logger.debug(f"Semantic cache hit in {bucket_key}")
+            return cached
+    except Exception as e:
+        logger.warning(f"Semantic cache read error: {e}")
+
+    responses = await compute_fn(vector)
+
+    if responses:
+        try:
+            await _store(bucket_key, signatures, vector, responses)
+        except Exception as e:
+            logger.warning(f"Semantic cache write error: {e}")
+
+    return responses
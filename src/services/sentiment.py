@@ -296,6 +296,38 @@ Respond in detailed JSON format:
         
         result = model(text[:512])[0]  # Limit length
         
+        return self._huggingface_result(text, language, result)
+    
+    def _analyze_batch_with_huggingface(
+        self,
+        texts: List[str],
+        language: str = "en"
+    ) -> List[Dict]:
+        """Analyze several texts in one HuggingFace pipeline call."""
+        
+        self._load_huggingface_models()
+        
+        model = self._hf_model_tr if language == "tr" else self._hf_model_en
+        
+        if model is None:
+            raise RuntimeError("HuggingFace model not available")
+        
+        # One batched forward pass instead of one per text
+        results = model([text[:512] for text in texts])
+        
+        return [
+            self._huggingface_result(text, language, result)
+            for text, result in zip(texts, results)
+        ]
+    
+    def _huggingface_result(
+        self,
+        text: str,
+        language: str,
+        result: Dict
+    ) -> Dict:
+        """Map a HuggingFace pipeline prediction to our schema."""
+        
         label = result["label"].lower()
         hf_score = result["score"]
         
@@ -441,12 +473,22 @@ Respond in detailed JSON format:
     async def analyze_batch(
         self,
         texts: List[str],
-        language: str = "en"
+        language: str = "en",
+        method: str = "auto"
     ) -> List[Dict]:
         """Analyze sentiment for multiple texts."""
         import asyncio
         
-        tasks = [self.analyze(text, language) for text in texts]
+        # The local model can score the whole batch in one pass
+        if method == "huggingface" and self.use_huggingface:
+            non_empty = [text.strip()[:2000] for text in texts if text and text.strip()]
+            if len(non_empty) == len(texts):
+                try:
+                    return self._analyze_batch_with_huggingface(non_empty, language)
+                except Exception as e:
+                    logger.warning(f"Batched HuggingFace analysis failed: {e}")
+        
+        tasks = [self.analyze(text, language, method) for text in texts]
         return await asyncio.gather(*tasks)
 
 
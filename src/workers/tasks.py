@@ -19,10 +19,17 @@ from src.database import SyncSessionLocal
 from src.models.ticket import Ticket, TicketStatus
 from src.models.agent import Agent
 
+try:
+    # Installed with uvicorn[standard]; a faster drop-in for the stdlib loop
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 
 def run_async(coro):
     """Helper to run async code in sync context."""
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop()
     asyncio.set_event_loop(loop)
     try:
         return loop.run_until_complete(coro)
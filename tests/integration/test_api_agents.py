@@ -0,0 +1,80 @@
+"""
+Integration Tests for Agent API
+
+Tests for agent-related API endpoints.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+
+class TestAgentAPI:
+    """Integration tests for agent endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_create_agent(self, client: AsyncClient):
+        """Test creating a new agent via API."""
+        response = await client.post(
+            "/api/v1/agents",
+            json={
+                "email": "new.agent@example.com",
+                "name": "New Agent",
+                "skills": ["technical_issue"],
+                "languages": ["en"]
+            }
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["email"] == "new.agent@example.com"
+        assert data["status"] == "offline"
+        assert data["is_active"] == True
+
+    @pytest.mark.asyncio
+    async def test_create_agent_duplicate_email(self, client: AsyncClient, sample_agent):
+        """Test creating an agent with an existing email fails."""
+        response = await client.post(
+            "/api/v1/agents",
+            json={
+                "email": sample_agent.email,
+                "name": "Duplicate Agent"
+            }
+        )
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_list_agents(self, client: AsyncClient, sample_agent):
+        """Test listing agents."""
+        response = await client.get("/api/v1/agents")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["id"] == str(sample_agent.id)
+
+    @pytest.mark.asyncio
+    async def test_search_agents(self, client: AsyncClient, sample_agent):
+        """Test searching agents by name."""
+        response = await client.get(
+            "/api/v1/agents",
+            params={"search": "Test"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_filter_agents_by_skill(self, client: AsyncClient, sample_agent):
+        """Test filtering agents by skill and language."""
+        response = await client.get(
+            "/api/v1/agents",
+            params={"skill": "billing_question", "language": "en"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+        response = await client.get("/api/v1/agents", params={"skill": "billing"})
+        assert response.json()["total"] == 0
@@ -0,0 +1,244 @@
+"""
+Integration Tests for Configuration API
+
+Tests for category and routing rule endpoints.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from src.models.category import DEFAULT_CATEGORIES
+from src.models.rule import DEFAULT_ROUTING_RULES
+
+
+class TestCategoryAPI:
+    """Integration tests for category endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_seed_categories(self, client: AsyncClient):
+        """Test seeding default categories."""
+        response = await client.post("/api/v1/config/categories/seed")
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == len(DEFAULT_CATEGORIES)
+        assert data["skipped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_seed_categories_idempotent(
+        self,
+        client: AsyncClient,
+        sample_category
+    ):
+        """Test re-seeding only creates missing categories."""
+        response = await client.post("/api/v1/config/categories/seed")
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == len(DEFAULT_CATEGORIES) - 1
+        assert data["skipped"] == 1
+
+        response = await client.post("/api/v1/config/categories/seed")
+        data = response.json()
+        assert data["created"] == 0
+        assert data["skipped"] == len(DEFAULT_CATEGORIES)
+
+        list_response = await client.get("/api/v1/config/categories")
+        assert list_response.json()["total"] == len(DEFAULT_CATEGORIES)
+
+
+class TestRoutingRuleAPI:
+    """Integration tests for routing rule endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_seed_rules_idempotent(self, client: AsyncClient):
+        """Test re-seeding routing rules skips existing ones."""
+        response = await client.post("/api/v1/config/routing-rules/seed")
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == len(DEFAULT_ROUTING_RULES)
+        assert data["skipped"] == 0
+
+        response = await client.post("/api/v1/config/routing-rules/seed")
+        data = response.json()
+        assert data["created"] == 0
+        assert data["skipped"] == len(DEFAULT_ROUTING_RULES)
+
+    @pytest.mark.asyncio
+    async def test_list_reflects_mutations(self, client: AsyncClient):
+        """Test rule listings reflect creates and deletes."""
+        response = await client.get("/api/v1/config/routing-rules")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+        create_response = await client.post(
+            "/api/v1/config/routing-rules",
+            json={
+                "name": "VIP Escalation",
+                "rule_type": "customer",
+                "conditions": {"tiers": ["vip"]},
+                "action": "escalate",
+                "priority": 10
+            }
+        )
+        assert create_response.status_code == 201
+        rule_id = create_response.json()["id"]
+
+        response = await client.get("/api/v1/config/routing-rules")
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["id"] == rule_id
+        assert data["items"][0]["rule_type"] == "customer"
+        assert data["items"][0]["action"] == "escalate"
+
+        filtered = await client.get(
+            "/api/v1/config/routing-rules",
+            params={"rule_type": "keyword"}
+        )
+        assert filtered.json()["total"] == 0
+
+        delete_response = await client.delete(
+            f"/api/v1/config/routing-rules/{rule_id}"
+        )
+        assert delete_response.status_code == 204
+
+        response = await client.get("/api/v1/config/routing-rules")
+        assert response.json()["total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_create_rule_duplicate_name(self, client: AsyncClient):
+        """Test creating a rule with an existing name fails."""
+        await client.post("/api/v1/config/routing-rules/seed")
+
+        response = await client.post(
+            "/api/v1/config/routing-rules",
+            json={
+                "name": DEFAULT_ROUTING_RULES[0]["name"],
+                "rule_type": "customer",
+                "conditions": {"tiers": ["vip"]},
+                "action": "escalate"
+            }
+        )
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_update_rule_duplicate_name(self, client: AsyncClient):
+        """Test renaming a rule to an existing name fails."""
+        await client.post("/api/v1/config/routing-rules/seed")
+
+        create_response = await client.post(
+            "/api/v1/config/routing-rules",
+            json={
+                "name": "Keyword Rule",
+                "rule_type": "keyword",
+                "conditions": {"keywords": ["urgent"]},
+                "action": "escalate"
+            }
+        )
+        rule_id = create_response.json()["id"]
+
+        response = await client.patch(
+            f"/api/v1/config/routing-rules/{rule_id}",
+            json={"name": DEFAULT_ROUTING_RULES[0]["name"]}
+        )
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_update_rule_null_required_fields(self, client: AsyncClient):
+        """Test nulling a required rule field is rejected."""
+        create_response = await client.post(
+            "/api/v1/config/routing-rules",
+            json={
+                "name": "Keyword Rule",
+                "rule_type": "keyword",
+                "conditions": {"keywords": ["urgent"]},
+                "action": "escalate"
+            }
+        )
+        rule_id = create_response.json()["id"]
+
+        for payload in ({"conditions": None}, {"name": None}):
+            response = await client.patch(
+                f"/api/v1/config/routing-rules/{rule_id}",
+                json=payload
+            )
+            assert response.status_code == 422
+
+        data = (await client.get("/api/v1/config/routing-rules")).json()
+        assert data["items"][0]["name"] == "Keyword Rule"
+        assert data["items"][0]["conditions"] == {"keywords": ["urgent"]}
+
+    @pytest.mark.asyncio
+    async def test_create_rule_invalid_type(self, client: AsyncClient):
+        """Test creating a rule with an unknown rule type is rejected."""
+        response = await client.post(
+            "/api/v1/config/routing-rules",
+            json={
+                "name": "Bad Rule",
+                "rule_type": "unknown",
+                "conditions": {},
+                "action": "escalate"
+            }
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_update_rule(self, client: AsyncClient):
+        """Test updating a routing rule."""
+        create_response = await client.post(
+            "/api/v1/config/routing-rules",
+            json={
+                "name": "Keyword Rule",
+                "rule_type": "keyword",
+                "conditions": {"keywords": ["urgent"]},
+                "action": "set_priority",
+                "priority": 5
+            }
+        )
+        rule_id = create_response.json()["id"]
+
+        response = await client.patch(
+            f"/api/v1/config/routing-rules/{rule_id}",
+            json={"priority": 20, "action": "escalate"}
+        )
+        assert response.status_code == 200
+
+        data = (await client.get("/api/v1/config/routing-rules")).json()
+        assert data["items"][0]["priority"] == 20
+        assert data["items"][0]["action"] == "escalate"
+
+    @pytest.mark.asyncio
+    async def test_update_rule_not_found(self, client: AsyncClient):
+        """Test updating a missing routing rule returns 404."""
+        response = await client.patch(
+            "/api/v1/config/routing-rules/00000000-0000-0000-0000-000000000000",
+            json={"priority": 1}
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_list_not_modified(self, client: AsyncClient):
+        """Test listing honours If-None-Match with the returned ETag."""
+        response = await client.get("/api/v1/config/routing-rules")
+        etag = response.headers["etag"]
+
+        response = await client.get(
+            "/api/v1/config/routing-rules",
+            headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        await client.post("/api/v1/config/routing-rules/seed")
+
+        response = await client.get(
+            "/api/v1/config/routing-rules",
+            headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
@@ -5,10 +5,11 @@ Tests for ticket-related API endpoints.
 """
 
 import pytest
+from datetime import datetime, timedelta
 from httpx import AsyncClient
 from uuid import uuid4
 
-from src.models.ticket import TicketStatus
+from src.models.ticket import Ticket, TicketStatus
 
 
 class TestTicketAPI:
@@ -33,6 +34,28 @@ class TestTicketAPI:
         assert "ticket_id" in data
         assert data["status"] in ["processed", "queued"]
     
+    @pytest.mark.asyncio
+    async def test_create_ticket_existing_customer(
+        self,
+        client: AsyncClient,
+        sample_customer
+    ):
+        """Test a ticket from a known email is linked to that customer."""
+        response = await client.post(
+            "/api/v1/tickets",
+            json={
+                "content": "Faturamda hata var",
+                "customer_email": sample_customer.email,
+                "process_async": False
+            }
+        )
+        
+        assert response.status_code == 201
+        ticket_id = response.json()["ticket_id"]
+        
+        get_response = await client.get(f"/api/v1/tickets/{ticket_id}")
+        assert get_response.json()["customer_id"] == str(sample_customer.id)
+    
     @pytest.mark.asyncio
     async def test_create_ticket_minimal(self, client: AsyncClient):
         """Test creating a ticket with minimal data."""
@@ -97,6 +120,13 @@ class TestTicketAPI:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data["items"], list)
+        assert data["total"] == 1
+        
+        response = await client.get(
+            "/api/v1/tickets",
+            params={"min_priority": 5, "is_processed": True}
+        )
+        assert response.json()["total"] == 0
     
     @pytest.mark.asyncio
     async def test_list_tickets_pagination(self, client: AsyncClient):
@@ -111,6 +141,47 @@ class TestTicketAPI:
         assert data["page"] == 1
         assert data["page_size"] == 5
     
+    @pytest.mark.asyncio
+    async def test_list_tickets_total(self, client: AsyncClient, sample_ticket):
+        """Test the total is reported on and past the last page."""
+        response = await client.get("/api/v1/tickets")
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["id"] == str(sample_ticket.id)
+        
+        response = await client.get("/api/v1/tickets", params={"page": 3})
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_list_tickets_keyset(self, client: AsyncClient, db_session):
+        """Test following next_cursor visits every ticket once."""
+        now = datetime.utcnow()
+        for i in range(5):
+            db_session.add(Ticket(
+                content=f"Ticket {i}",
+                created_at=now - timedelta(minutes=i)
+            ))
+        await db_session.commit()
+        
+        response = await client.get("/api/v1/tickets", params={"page_size": 2})
+        data = response.json()
+        seen = [item["id"] for item in data["items"]]
+        assert data["total"] == 5
+        
+        while data["next_cursor"]:
+            response = await client.get(
+                "/api/v1/tickets",
+                params={"page_size": 2, **data["next_cursor"]}
+            )
+            data = response.json()
+            seen.extend(item["id"] for item in data["items"])
+        
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+        assert data["total"] == 1
+    
     @pytest.mark.asyncio
     async def test_update_ticket(self, client: AsyncClient, sample_ticket):
         """Test updating a ticket."""
@@ -166,6 +237,24 @@ class TestTicketAPI:
         )
         
         assert response.status_code == 200
+        assert response.json()["assigned_agent_id"] == str(sample_agent.id)
+        
+        agent_response = await client.get(f"/api/v1/agents/{sample_agent.id}")
+        assert agent_response.json()["current_load"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_reassign_ticket_agent_not_found(
+        self,
+        client: AsyncClient,
+        sample_ticket
+    ):
+        """Test reassigning to a missing agent fails."""
+        response = await client.post(
+            f"/api/v1/tickets/{sample_ticket.id}/reassign",
+            json={"agent_id": "00000000-0000-0000-0000-000000000000"}
+        )
+        
+        assert response.status_code == 404
     
     @pytest.mark.asyncio
     async def test_delete_ticket(self, client: AsyncClient, sample_ticket):
@@ -177,6 +266,103 @@ class TestTicketAPI:
         # Verify deleted
         get_response = await client.get(f"/api/v1/tickets/{sample_ticket.id}")
         assert get_response.status_code == 404
+    
+    @pytest.mark.asyncio
+    async def test_bulk_update_tickets(self, client: AsyncClient, sample_ticket):
+        """Test bulk updating tickets, including a missing ID."""
+        missing_id = "00000000-0000-0000-0000-000000000000"
+        response = await client.post(
+            "/api/v1/tickets/bulk",
+            json={
+                "ticket_ids": [str(sample_ticket.id), missing_id],
+                "category": "billing_question",
+                "add_tags": ["bulk"]
+            }
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == 1
+        assert data["failed"] == 1
+        assert data["errors"] == [{"ticket_id": missing_id, "error": "not_found"}]
+        
+        get_response = await client.get(f"/api/v1/tickets/{sample_ticket.id}")
+        ticket = get_response.json()
+        assert ticket["category"] == "billing_question"
+        assert "bulk" in ticket["tags"]
+    
+    @pytest.mark.asyncio
+    async def test_bulk_update_status(self, client: AsyncClient, sample_ticket):
+        """Test bulk updating shared fields without tag changes."""
+        response = await client.post(
+            "/api/v1/tickets/bulk",
+            json={
+                "ticket_ids": [str(sample_ticket.id)],
+                "status": "closed",
+                "priority": 2
+            }
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["updated"] == 1
+        
+        get_response = await client.get(f"/api/v1/tickets/{sample_ticket.id}")
+        ticket = get_response.json()
+        assert ticket["status"] == "closed"
+        assert ticket["priority"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_bulk_reassign_updates_agent_load(
+        self,
+        client: AsyncClient,
+        db_session,
+        sample_agent
+    ):
+        """Test bulk reassignment moves load onto the new agent once."""
+        tickets = [Ticket(content=f"Ticket {i}") for i in range(3)]
+        db_session.add_all(tickets)
+        await db_session.commit()
+        
+        response = await client.post(
+            "/api/v1/tickets/bulk",
+            json={
+                "ticket_ids": [str(t.id) for t in tickets],
+                "assigned_agent_id": str(sample_agent.id)
+            }
+        )
+        assert response.status_code == 200
+        assert response.json()["updated"] == 3
+        
+        agent_response = await client.get(f"/api/v1/agents/{sample_agent.id}")
+        assert agent_response.json()["current_load"] == 3
+        
+        # Already assigned tickets do not count twice
+        response = await client.post(
+            "/api/v1/tickets/bulk",
+            json={
+                "ticket_ids": [str(tickets[0].id)],
+                "assigned_agent_id": str(sample_agent.id)
+            }
+        )
+        agent_response = await client.get(f"/api/v1/agents/{sample_agent.id}")
+        assert agent_response.json()["current_load"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_bulk_reassign_agent_not_found(
+        self,
+        client: AsyncClient,
+        sample_ticket
+    ):
+        """Test bulk reassignment to a missing agent fails."""
+        response = await client.post(
+            "/api/v1/tickets/bulk",
+            json={
+                "ticket_ids": [str(sample_ticket.id)],
+                "assigned_agent_id": "00000000-0000-0000-0000-000000000000"
+            }
+        )
+        
+        assert response.status_code == 404
 
 
 class TestTicketSearch:
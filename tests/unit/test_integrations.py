@@ -0,0 +1,160 @@
+"""
+Tests for Integrations
+
+Unit tests for the integration package's import footprint, HTTP retries,
+ticket caching and the shared Redis client.
+"""
+
+import asyncio
+import subprocess
+import sys
+from dataclasses import asdict
+
+import httpx
+import pytest
+
+import src.cache
+from src.cache import get_redis
+from src.integrations.base import CachingIntegration, ExternalTicket
+from src.integrations.http import RETRY_MAX_WAIT, _retry_delay
+
+
+def _modules_after_import(statement: str) -> set:
+    """Import in a fresh interpreter and return the loaded module names."""
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestIntegrationImports:
+    """Tests for lazy loading of vendor clients."""
+    
+    def test_base_has_no_vendor_imports(self):
+        """Test importing the base module loads no HTTP or vendor modules."""
+        modules = _modules_after_import("import src.integrations.base")
+        
+        assert "httpx" not in modules
+        assert "src.integrations.zendesk" not in modules
+        assert "src.integrations.freshdesk" not in modules
+    
+    def test_clients_load_on_access(self):
+        """Test vendor clients are imported only when accessed."""
+        modules = _modules_after_import(
+            "from src.integrations import ZendeskClient"
+        )
+        
+        assert "src.integrations.zendesk" in modules
+        assert "src.integrations.freshdesk" not in modules
+
+
+class TestRetryDelay:
+    """Tests for the shared HTTP client's retry policy."""
+    
+    def test_transient_failures_back_off(self):
+        """Test transport errors and 5xx responses back off exponentially."""
+        assert _retry_delay(None, 0) == 1.0
+        assert _retry_delay(httpx.Response(503), 1) == 2.0
+        assert _retry_delay(httpx.Response(500), 10) == RETRY_MAX_WAIT
+    
+    def test_rate_limit_honours_retry_after(self):
+        """Test 429 waits for Retry-After and gives up when it is too long."""
+        assert _retry_delay(httpx.Response(429, headers={"Retry-After": "3"}), 0) == 3.0
+        assert _retry_delay(httpx.Response(429, headers={"Retry-After": "120"}), 0) is None
+        assert _retry_delay(httpx.Response(429), 1) == 2.0
+    
+    def test_client_errors_are_final(self):
+        """Test other 4xx responses are not retried."""
+        assert _retry_delay(httpx.Response(404), 0) is None
+        assert _retry_delay(httpx.Response(400), 0) is None
+
+
+class TestSharedRedisClient:
+    """Tests for reuse of the shared Redis client across event loops."""
+    
+    def test_new_client_per_event_loop(self):
+        """Test each event loop gets its own client, reused within the loop."""
+        async def clients():
+            return get_redis(), get_redis()
+        
+        first, again = asyncio.run(clients())
+        second, _ = asyncio.run(clients())
+        
+        assert first is again
+        assert second is not first
+
+
+class _StaticIntegration(CachingIntegration):
+    """Integration serving one fixed ticket."""
+    
+    def __init__(self, ticket: ExternalTicket):
+        self.ticket = ticket
+    
+    async def authenticate(self):
+        return True
+    
+    async def get_ticket(self, ticket_id):
+        return self.ticket
+    
+    async def get_tickets(self, *args, **kwargs):
+        return [self.ticket]
+    
+    async def stream_tickets(self, *args, **kwargs):
+        yield self.ticket
+    
+    async def create_ticket(self, *args, **kwargs):
+        return self.ticket
+    
+    async def update_ticket(self, *args, **kwargs):
+        return True
+    
+    async def add_comment(self, *args, **kwargs):
+        return True
+    
+    async def close(self):
+        pass
+
+
+class TestTicketCache:
+    """Tests for the Redis copy of external tickets."""
+    
+    @pytest.mark.asyncio
+    async def test_cached_ticket_matches_original(self, monkeypatch):
+        """Test a ticket read back from Redis equals the fetched one."""
+        ticket = ExternalTicket(
+            id="42",
+            subject="Login fails",
+            content="Cannot sign in",
+            status="open",
+            priority=3,
+            requester_email="user@example.com",
+            requester_name="User",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at=None,
+            tags=("login",),
+            custom_fields={360001: "technical_issue", "region": "eu"}
+        )
+        stored = {}
+        
+        async def cache_get(key):
+            return stored.get(key)
+        
+        async def cache_set(key, value, ttl):
+            stored[key] = value
+        
+        monkeypatch.setattr(src.cache, "cache_get", cache_get)
+        monkeypatch.setattr(src.cache, "cache_set", cache_set)
+        
+        integration = _StaticIntegration(ticket)
+        key = integration._ticket_cache_key(ticket.id)
+        await integration._load_ticket(key, ticket.id, refresh=False)
+        
+        integration.ticket = None
+        cached = await integration._load_ticket(key, ticket.id, refresh=False)
+        
+        assert asdict(cached) == asdict(ticket)
+        assert list(cached.custom_fields) == [360001, "region"]